@@ -131,6 +131,14 @@ else:
     }
     print("📦 Using SQLite for local development")
 
+# External connection pooler (PgBouncer, Railway/Supabase pooler, etc.)
+# Point DATABASE_URL / DB_* at the pooler and set USE_PGBOUNCER=True.
+# Transaction pooling can hand each transaction a different server
+# connection, so server-side cursors (used by .iterator()) must be disabled.
+USE_PGBOUNCER = os.getenv('USE_PGBOUNCER', 'False') == 'True'
+if USE_PGBOUNCER and DATABASES['default']['ENGINE'] == 'django.db.backends.postgresql':
+    DATABASES['default']['DISABLE_SERVER_SIDE_CURSORS'] = True
+
 # Custom User Model
 AUTH_USER_MODEL = 'authentication.CustomUser'
 
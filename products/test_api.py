@@ -602,11 +602,10 @@ class ImageUploadAPITest(APITestCase):
         img = Image.new('RGB', size, color=color)
         img_io = BytesIO()
         img.save(img_io, format='JPEG')
-        img_io.seek(0)
         
         return SimpleUploadedFile(
             "test_image.jpg",
-            img_io.read(),
+            img_io.getvalue(),
             content_type="image/jpeg"
         )
     
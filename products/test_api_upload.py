@@ -0,0 +1,69 @@
+"""
+Test image upload through the admin API endpoint
+"""
+from decimal import Decimal
+
+from django.contrib.auth import get_user_model
+from django.core.files.uploadedfile import SimpleUploadedFile
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from products.models import Package, ProductImage
+from products.testing import encode_test_jpeg
+
+User = get_user_model()
+
+
+# 800x600, encoded once; uploads reuse the bytes
+TEST_JPEG_BYTES = encode_test_jpeg((800, 600), 'green')
+
+
+class PackageImageUploadAPITest(APITestCase):
+    """Upload a package image through the admin API"""
+    
+    @classmethod
+    def setUpTestData(cls):
+        """Create the admin user and package once; rolled back after the class"""
+        cls.admin_user = User.objects.create_user(
+            username='admin',
+            email='admin@test.com',
+            phone_number='1234567890',
+            is_staff=True,
+            is_superuser=True
+        )
+        
+        cls.package = Package.objects.create(
+            name='Test Package API',
+            price=Decimal('100.00'),
+            description='Test package for API upload',
+            features=['Feature 1'],
+            deliverables=['Deliverable 1'],
+            created_by=cls.admin_user
+        )
+    
+    def setUp(self):
+        self.client.force_authenticate(user=self.admin_user)
+    
+    def test_upload_package_image(self):
+        """Test that an admin can upload a primary image for a package"""
+        response = self.client.post(
+            f'/api/admin/products/package/{self.package.id}/images/',
+            {
+                'image': SimpleUploadedFile('test.jpg', TEST_JPEG_BYTES, content_type='image/jpeg'),
+                'alt_text': 'Test image via API',
+                'is_primary': True
+            },
+            format='multipart'
+        )
+        
+        image = ProductImage.objects.filter(id=response.data.get('id')).first()
+        if image:
+            # Rows roll back with the test, but stored files must be removed explicitly
+            self.addCleanup(image.image.delete, save=False)
+            if image.thumbnail:
+                self.addCleanup(image.thumbnail.delete, save=False)
+        
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertIsNotNone(image)
+        self.assertTrue(image.is_primary)
+        self.assertEqual(image.alt_text, 'Test image via API')
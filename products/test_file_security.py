@@ -0,0 +1,85 @@
+"""
+Tests for the file upload security implementation
+"""
+from django.conf import settings
+from django.core.exceptions import ValidationError
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import SimpleTestCase
+
+from products.testing import encode_test_jpeg
+from products.validators import validate_image_file
+
+
+# Encoded once; each test wraps the bytes in its own SimpleUploadedFile
+TEST_JPEG_BYTES = encode_test_jpeg()
+
+
+class FileUploadSecurityTest(SimpleTestCase):
+    """Validators, storage and views behind secure file uploads"""
+    
+    def test_valid_image_accepted(self):
+        """A real JPEG passes image validation"""
+        test_file = SimpleUploadedFile(
+            "test.jpg",
+            TEST_JPEG_BYTES,
+            content_type="image/jpeg"
+        )
+        
+        validate_image_file(test_file)
+    
+    def test_oversized_image_rejected(self):
+        """Images over 5MB are rejected"""
+        # The validator rejects on .size before reading any content,
+        # so no 6MB buffer is needed
+        large_file = SimpleUploadedFile(
+            "large.jpg",
+            b'',
+            content_type="image/jpeg"
+        )
+        large_file.size = 6 * 1024 * 1024  # 6MB
+        
+        with self.assertRaises(ValidationError):
+            validate_image_file(large_file)
+    
+    def test_invalid_extension_rejected(self):
+        """Non-image extensions are rejected"""
+        invalid_file = SimpleUploadedFile(
+            "test.exe",
+            b'MZ\x90\x00',  # PE executable signature
+            content_type="application/x-msdownload"
+        )
+        
+        with self.assertRaises(ValidationError):
+            validate_image_file(invalid_file)
+    
+    def test_secure_media_root_configured(self):
+        """SECURE_MEDIA_ROOT is set"""
+        self.assertTrue(hasattr(settings, 'SECURE_MEDIA_ROOT'))
+    
+    def test_secure_filename_randomized(self):
+        """Secure storage never keeps the uploaded filename"""
+        from products.storage import SecureFileStorage
+        
+        self.assertNotEqual(SecureFileStorage().get_available_name("test.jpg"), "test.jpg")
+    
+    def test_document_validator_available(self):
+        """The document validator is importable"""
+        # Real MIME checks need actual PDF content, so only availability is tested
+        from products.validators import validate_document_file
+        
+        self.assertTrue(callable(validate_document_file))
+    
+    def test_upload_middleware_available(self):
+        """The upload security and rate-limit middleware are importable"""
+        from products.middleware import FileUploadSecurityMiddleware, FileUploadRateLimitMiddleware
+        
+        self.assertTrue(callable(FileUploadSecurityMiddleware))
+        self.assertTrue(callable(FileUploadRateLimitMiddleware))
+    
+    def test_file_serving_views_available(self):
+        """The secure file serving views are importable"""
+        from products.file_views import serve_product_image, serve_dynamic_resource, serve_order_resource
+        
+        self.assertTrue(callable(serve_product_image))
+        self.assertTrue(callable(serve_dynamic_resource))
+        self.assertTrue(callable(serve_order_resource))
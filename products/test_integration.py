@@ -49,11 +49,10 @@ class ProductCreationWorkflowTest(APITestCase):
         img = Image.new('RGB', size, color=color)
         img_io = BytesIO()
         img.save(img_io, format='JPEG')
-        img_io.seek(0)
         
         return SimpleUploadedFile(
             f"test_image_{color}.jpg",
-            img_io.read(),
+            img_io.getvalue(),
             content_type="image/jpeg"
         )
     
@@ -290,11 +290,10 @@ class ProductImageModelTest(TestCase):
         img = Image.new('RGB', size, color=color)
         img_io = BytesIO()
         img.save(img_io, format=format)
-        img_io.seek(0)
         
         return SimpleUploadedFile(
             f"test_image.{format.lower()}",
-            img_io.read(),
+            img_io.getvalue(),
             content_type=f"image/{format.lower()}"
         )
     
@@ -0,0 +1,13 @@
+"""
+Helpers shared by the product tests and test scripts
+"""
+from io import BytesIO
+
+from PIL import Image
+
+
+def encode_test_jpeg(size=(100, 100), color='red', **save_options):
+    """Encode a solid-colour JPEG and return its bytes"""
+    buffer = BytesIO()
+    Image.new('RGB', size, color=color).save(buffer, format='JPEG', **save_options)
+    return buffer.getvalue()
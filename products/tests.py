@@ -4,7 +4,7 @@ Unit tests for product validation logic
 from django.test import TestCase
 from django.contrib.auth import get_user_model
 from django.contrib.contenttypes.models import ContentType
-from rest_framework.test import APITestCase
+from rest_framework.test import APITestCase, APIClient
 from rest_framework import status
 from decimal import Decimal
 from .models import Package, Campaign
@@ -12,16 +12,24 @@ from orders.models import Order, OrderItem
 
 User = get_user_model()
 
+DUPLICATE_NAME_MSG = 'already exists'
+NON_POSITIVE_PRICE_MSG = 'greater than zero'
+
+PRICE_50 = Decimal('50.00')
+PRICE_100 = Decimal('100.00')
+PRICE_200 = Decimal('200.00')
+
 
 class ProductValidationTestCase(TestCase):
     """Test product model validation logic"""
     
-    def setUp(self):
-        """Set up test data"""
-        self.admin_user = User.objects.create_user(
+    @classmethod
+    def setUpTestData(cls):
+        """Set up test data once per class"""
+        # No password: tests never log in with one, so skip the PBKDF2 hashing
+        cls.admin_user = User.objects.create_user(
             username='admin',
             email='admin@test.com',
-            password='testpass123',
             phone_number='1234567890',
             first_name='Admin',
             last_name='User',
@@ -29,42 +37,49 @@ class ProductValidationTestCase(TestCase):
             is_superuser=True
         )
         
-        self.package = Package.objects.create(
+        cls.package = Package.objects.create(
             name='Test Package',
-            price=Decimal('100.00'),
+            price=PRICE_100,
             description='Test description',
-            created_by=self.admin_user
+            created_by=cls.admin_user
         )
         
-        self.campaign = Campaign.objects.create(
+        cls.campaign = Campaign.objects.create(
             name='Test Campaign',
-            price=Decimal('50.00'),
+            price=PRICE_50,
             unit='per unit',
             description='Test campaign description',
-            created_by=self.admin_user
+            created_by=cls.admin_user
         )
     
     def test_package_creation(self):
         """Test that packages can be created with valid data"""
-        package = Package.objects.create(
+        # Field validation only; persistence is covered by the API tests
+        package = Package(
             name='New Package',
-            price=Decimal('200.00'),
+            price=PRICE_200,
             description='New package description',
+            features=['Feature 1'],
+            deliverables=['Deliverable 1'],
             created_by=self.admin_user
         )
+        package.full_clean()
         self.assertEqual(package.name, 'New Package')
-        self.assertEqual(package.price, Decimal('200.00'))
+        self.assertEqual(package.price, PRICE_200)
         self.assertTrue(package.is_active)
     
     def test_campaign_creation(self):
         """Test that campaigns can be created with valid data"""
-        campaign = Campaign.objects.create(
+        campaign = Campaign(
             name='New Campaign',
             price=Decimal('75.00'),
             unit='per item',
             description='New campaign description',
+            features=['Feature 1'],
+            deliverables=['Deliverable 1'],
             created_by=self.admin_user
         )
+        campaign.full_clean()
         self.assertEqual(campaign.name, 'New Campaign')
         self.assertEqual(campaign.price, Decimal('75.00'))
         self.assertTrue(campaign.is_active)
@@ -73,12 +88,16 @@ class ProductValidationTestCase(TestCase):
 class ProductAPIValidationTestCase(APITestCase):
     """Test product API validation logic"""
     
-    def setUp(self):
-        """Set up test data"""
-        self.admin_user = User.objects.create_user(
+    # Product lookup + a single EXISTS check for active order items
+    BLOCKED_DELETE_QUERIES = 2
+    
+    @classmethod
+    def setUpTestData(cls):
+        """Set up test data once per class"""
+        # No password: tests never log in with one, so skip the PBKDF2 hashing
+        cls.admin_user = User.objects.create_user(
             username='admin',
             email='admin@test.com',
-            password='testpass123',
             phone_number='1234567890',
             first_name='Admin',
             last_name='User',
@@ -86,34 +105,59 @@ class ProductAPIValidationTestCase(APITestCase):
             is_superuser=True
         )
         
-        self.regular_user = User.objects.create_user(
+        cls.regular_user = User.objects.create_user(
             username='user',
             email='user@test.com',
-            password='testpass123',
             phone_number='0987654321',
             first_name='Regular',
             last_name='User'
         )
         
-        self.package = Package.objects.create(
+        cls.package = Package.objects.create(
             name='Existing Package',
-            price=Decimal('100.00'),
+            price=PRICE_100,
             description='Test description',
-            created_by=self.admin_user
+            created_by=cls.admin_user
         )
         
-        self.campaign = Campaign.objects.create(
+        cls.campaign = Campaign.objects.create(
             name='Existing Campaign',
-            price=Decimal('50.00'),
+            price=PRICE_50,
             unit='per unit',
             description='Test campaign description',
-            created_by=self.admin_user
+            created_by=cls.admin_user
         )
+        
+        cls.package_ct = ContentType.objects.get_for_model(Package)
+        cls.campaign_ct = ContentType.objects.get_for_model(Campaign)
+        
+        cls.admin_client = APIClient()
+        cls.admin_client.force_authenticate(user=cls.admin_user)
+    
+    def _create_order_with_items(self, product, content_type, item_count=1, **order_fields):
+        """Create an order holding item_count line items for product"""
+        order = Order.objects.create(user=self.regular_user, **order_fields)
+        OrderItem.objects.bulk_create([
+            OrderItem(
+                order=order,
+                content_type=content_type,
+                object_id=product.id,
+                quantity=1,
+                price=product.price
+            )
+            for _ in range(item_count)
+        ])
+        return order
+    
+    def _assert_field_error(self, response, field, message=None):
+        """Assert a 400 response with an error on field, optionally containing message"""
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn(field, response.data)
+        if message is not None:
+            self.assertIn(message, str(response.data[field][0]).casefold())
     
     def test_unique_package_name_validation_on_create(self):
         """Test that duplicate package names are rejected on creation"""
-        self.client.force_authenticate(user=self.admin_user)
-        
         data = {
             'name': 'Existing Package',  # Duplicate name
             'price': 150.00,
@@ -121,19 +165,15 @@ class ProductAPIValidationTestCase(APITestCase):
             'is_active': True
         }
         
-        response = self.client.post('/api/admin/products/package/', data, format='json')
-        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
-        self.assertIn('name', response.data)
-        self.assertIn('already exists', str(response.data['name'][0]).lower())
+        response = self.admin_client.post('/api/admin/products/package/', data, format='json')
+        self._assert_field_error(response, 'name', DUPLICATE_NAME_MSG)
     
     def test_unique_package_name_validation_on_update(self):
         """Test that duplicate package names are rejected on update"""
-        self.client.force_authenticate(user=self.admin_user)
-        
         # Create another package
         other_package = Package.objects.create(
             name='Other Package',
-            price=Decimal('200.00'),
+            price=PRICE_200,
             description='Other description',
             created_by=self.admin_user
         )
@@ -146,18 +186,15 @@ class ProductAPIValidationTestCase(APITestCase):
             'is_active': True
         }
         
-        response = self.client.put(
+        response = self.admin_client.put(
             f'/api/admin/products/package/{other_package.id}/update/',
             data,
             format='json'
         )
-        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
-        self.assertIn('name', response.data)
+        self._assert_field_error(response, 'name')
     
     def test_unique_campaign_name_validation_on_create(self):
         """Test that duplicate campaign names are rejected on creation"""
-        self.client.force_authenticate(user=self.admin_user)
-        
         data = {
             'name': 'Existing Campaign',  # Duplicate name
             'price': 75.00,
@@ -166,19 +203,15 @@ class ProductAPIValidationTestCase(APITestCase):
             'is_active': True
         }
         
-        response = self.client.post('/api/admin/products/campaign/', data, format='json')
-        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
-        self.assertIn('name', response.data)
-        self.assertIn('already exists', str(response.data['name'][0]).lower())
+        response = self.admin_client.post('/api/admin/products/campaign/', data, format='json')
+        self._assert_field_error(response, 'name', DUPLICATE_NAME_MSG)
     
     def test_unique_campaign_name_validation_on_update(self):
         """Test that duplicate campaign names are rejected on update"""
-        self.client.force_authenticate(user=self.admin_user)
-        
         # Create another campaign
         other_campaign = Campaign.objects.create(
             name='Other Campaign',
-            price=Decimal('100.00'),
+            price=PRICE_100,
             unit='per unit',
             description='Other description',
             created_by=self.admin_user
@@ -193,18 +226,15 @@ class ProductAPIValidationTestCase(APITestCase):
             'is_active': True
         }
         
-        response = self.client.put(
+        response = self.admin_client.put(
             f'/api/admin/products/campaign/{other_campaign.id}/update/',
             data,
             format='json'
         )
-        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
-        self.assertIn('name', response.data)
+        self._assert_field_error(response, 'name')
     
     def test_positive_price_validation_for_package(self):
         """Test that negative or zero prices are rejected for packages"""
-        self.client.force_authenticate(user=self.admin_user)
-        
         # Test zero price
         data = {
             'name': 'Zero Price Package',
@@ -213,21 +243,16 @@ class ProductAPIValidationTestCase(APITestCase):
             'is_active': True
         }
         
-        response = self.client.post('/api/admin/products/package/', data, format='json')
-        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
-        self.assertIn('price', response.data)
-        self.assertIn('greater than zero', str(response.data['price'][0]).lower())
+        response = self.admin_client.post('/api/admin/products/package/', data, format='json')
+        self._assert_field_error(response, 'price', NON_POSITIVE_PRICE_MSG)
         
         # Test negative price
         data['price'] = -50.00
-        response = self.client.post('/api/admin/products/package/', data, format='json')
-        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
-        self.assertIn('price', response.data)
+        response = self.admin_client.post('/api/admin/products/package/', data, format='json')
+        self._assert_field_error(response, 'price')
     
     def test_positive_price_validation_for_campaign(self):
         """Test that negative or zero prices are rejected for campaigns"""
-        self.client.force_authenticate(user=self.admin_user)
-        
         # Test zero price
         data = {
             'name': 'Zero Price Campaign',
@@ -237,30 +262,25 @@ class ProductAPIValidationTestCase(APITestCase):
             'is_active': True
         }
         
-        response = self.client.post('/api/admin/products/campaign/', data, format='json')
-        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
-        self.assertIn('price', response.data)
-        self.assertIn('greater than zero', str(response.data['price'][0]).lower())
+        response = self.admin_client.post('/api/admin/products/campaign/', data, format='json')
+        self._assert_field_error(response, 'price', NON_POSITIVE_PRICE_MSG)
         
         # Test negative price
         data['price'] = -25.00
-        response = self.client.post('/api/admin/products/campaign/', data, format='json')
-        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
-        self.assertIn('price', response.data)
+        response = self.admin_client.post('/api/admin/products/campaign/', data, format='json')
+        self._assert_field_error(response, 'price')
     
     def test_delete_product_without_active_orders(self):
         """Test that products without active orders can be deleted"""
-        self.client.force_authenticate(user=self.admin_user)
-        
         # Create a package without orders
         package = Package.objects.create(
             name='Deletable Package',
-            price=Decimal('100.00'),
+            price=PRICE_100,
             description='Can be deleted',
             created_by=self.admin_user
         )
         
-        response = self.client.delete(f'/api/admin/products/package/{package.id}/delete/')
+        response = self.admin_client.delete(f'/api/admin/products/package/{package.id}/delete/')
         self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
         
         # Verify package is deleted
@@ -268,56 +288,49 @@ class ProductAPIValidationTestCase(APITestCase):
     
     def test_prevent_delete_product_with_pending_orders(self):
         """Test that products with pending orders cannot be deleted"""
-        self.client.force_authenticate(user=self.admin_user)
-        
         # Create an order with the package
-        order = Order.objects.create(
-            user=self.regular_user,
-            total_amount=Decimal('100.00'),
+        self._create_order_with_items(
+            self.package,
+            self.package_ct,
+            total_amount=PRICE_100,
             status='pending_payment'
         )
         
-        content_type = ContentType.objects.get_for_model(Package)
-        OrderItem.objects.create(
-            order=order,
-            content_type=content_type,
-            object_id=self.package.id,
-            quantity=1,
-            price=self.package.price
-        )
-        
-        response = self.client.delete(f'/api/admin/products/package/{self.package.id}/delete/')
-        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
-        self.assertIn('error', response.data)
+        with self.assertNumQueries(self.BLOCKED_DELETE_QUERIES):
+            response = self.admin_client.delete(f'/api/admin/products/package/{self.package.id}/delete/')
+        self._assert_field_error(response, 'error')
         self.assertIn('pending or in-progress orders', str(response.data['error']).lower())
         
         # Verify package still exists
         self.assertTrue(Package.objects.filter(id=self.package.id).exists())
     
+    def test_blocked_delete_query_count_independent_of_order_items(self):
+        """Test that the active-order check does not query per order item"""
+        self._create_order_with_items(
+            self.package,
+            self.package_ct,
+            item_count=10,
+            total_amount=Decimal('1000.00'),
+            status='pending_payment'
+        )
+        
+        with self.assertNumQueries(self.BLOCKED_DELETE_QUERIES):
+            response = self.admin_client.delete(f'/api/admin/products/package/{self.package.id}/delete/')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+    
     def test_prevent_delete_product_with_in_progress_orders(self):
         """Test that products with in-progress orders cannot be deleted"""
-        self.client.force_authenticate(user=self.admin_user)
-        
         # Create an order with the campaign
-        order = Order.objects.create(
-            user=self.regular_user,
-            total_amount=Decimal('50.00'),
+        self._create_order_with_items(
+            self.campaign,
+            self.campaign_ct,
+            total_amount=PRICE_50,
             status='in_progress',
             assigned_to=self.admin_user
         )
         
-        content_type = ContentType.objects.get_for_model(Campaign)
-        OrderItem.objects.create(
-            order=order,
-            content_type=content_type,
-            object_id=self.campaign.id,
-            quantity=1,
-            price=self.campaign.price
-        )
-        
-        response = self.client.delete(f'/api/admin/products/campaign/{self.campaign.id}/delete/')
-        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
-        self.assertIn('error', response.data)
+        response = self.admin_client.delete(f'/api/admin/products/campaign/{self.campaign.id}/delete/')
+        self._assert_field_error(response, 'error')
         self.assertIn('pending or in-progress orders', str(response.data['error']).lower())
         
         # Verify campaign still exists
@@ -325,32 +338,22 @@ class ProductAPIValidationTestCase(APITestCase):
     
     def test_allow_delete_product_with_completed_orders(self):
         """Test that products with only completed orders can be deleted"""
-        self.client.force_authenticate(user=self.admin_user)
-        
         # Create a package with a completed order
         package = Package.objects.create(
             name='Completed Package',
-            price=Decimal('100.00'),
+            price=PRICE_100,
             description='Has completed order',
             created_by=self.admin_user
         )
         
-        order = Order.objects.create(
-            user=self.regular_user,
-            total_amount=Decimal('100.00'),
+        self._create_order_with_items(
+            package,
+            self.package_ct,
+            total_amount=PRICE_100,
             status='completed'
         )
         
-        content_type = ContentType.objects.get_for_model(Package)
-        OrderItem.objects.create(
-            order=order,
-            content_type=content_type,
-            object_id=package.id,
-            quantity=1,
-            price=package.price
-        )
-        
-        response = self.client.delete(f'/api/admin/products/package/{package.id}/delete/')
+        response = self.admin_client.delete(f'/api/admin/products/package/{package.id}/delete/')
         self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
         
         # Verify package is deleted but order item still references it
@@ -359,8 +362,6 @@ class ProductAPIValidationTestCase(APITestCase):
     
     def test_valid_package_creation(self):
         """Test that packages with valid data are created successfully"""
-        self.client.force_authenticate(user=self.admin_user)
-        
         data = {
             'name': 'Valid Package',
             'price': 150.00,
@@ -372,15 +373,13 @@ class ProductAPIValidationTestCase(APITestCase):
             ]
         }
         
-        response = self.client.post('/api/admin/products/package/', data, format='json')
+        response = self.admin_client.post('/api/admin/products/package/', data, format='json')
         self.assertEqual(response.status_code, status.HTTP_201_CREATED)
         self.assertEqual(response.data['name'], 'Valid Package')
         self.assertEqual(float(response.data['price']), 150.00)
     
     def test_valid_campaign_creation(self):
         """Test that campaigns with valid data are created successfully"""
-        self.client.force_authenticate(user=self.admin_user)
-        
         data = {
             'name': 'Valid Campaign',
             'price': 75.00,
@@ -389,7 +388,33 @@ class ProductAPIValidationTestCase(APITestCase):
             'is_active': True
         }
         
-        response = self.client.post('/api/admin/products/campaign/', data, format='json')
+        response = self.admin_client.post('/api/admin/products/campaign/', data, format='json')
         self.assertEqual(response.status_code, status.HTTP_201_CREATED)
         self.assertEqual(response.data['name'], 'Valid Campaign')
         self.assertEqual(float(response.data['price']), 75.00)
+    
+    def test_package_list_query_count(self):
+        """Test that listing packages is a single query however many exist"""
+        Package.objects.bulk_create(
+            Package(name=f'Listed Package {i}', price=PRICE_100, created_by=self.admin_user)
+            for i in range(10)
+        )
+        
+        # created_by is joined rather than fetched per package
+        with self.assertNumQueries(1):
+            response = self.admin_client.get('/api/admin/products/', {'type': 'package'})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data), Package.objects.count())
+    
+    def test_campaign_list_query_count(self):
+        """Test that listing campaigns is a single query however many exist"""
+        Campaign.objects.bulk_create(
+            Campaign(name=f'Listed Campaign {i}', price=PRICE_50, unit='per item', created_by=self.admin_user)
+            for i in range(10)
+        )
+        
+        # created_by is joined rather than fetched per campaign
+        with self.assertNumQueries(1):
+            response = self.admin_client.get('/api/admin/products/', {'type': 'campaign'})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data), Campaign.objects.count())
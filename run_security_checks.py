@@ -4,32 +4,129 @@ Comprehensive security and deployment checks
 Run before deploying to production
 """
 
+import ast
+import io
 import os
 import sys
 import subprocess
+from functools import lru_cache
+
+from script_utils import run_concurrently
+
+SETTINGS_FILE = 'election_cart/settings.py'
+
+SECURITY_CHECKLIST = (
+    "Generate new DJANGO_SECRET_KEY for production",
+    "Set DEBUG=False in production",
+    "Configure ALLOWED_HOSTS with your domain",
+    "Use DATABASE_URL from Railway",
+    "Switch to live Razorpay keys",
+    "Configure SENTRY_DSN for error tracking",
+    "Update CORS_ALLOWED_ORIGINS with frontend URL",
+    "Verify all secrets are in environment variables",
+    "Run collectstatic before deployment",
+    "Test health endpoint after deployment",
+)
+
+@lru_cache(maxsize=None)
+def project_files():
+    """Names in the project root, listed once with a single scandir pass"""
+    with os.scandir('.') as entries:
+        return frozenset(entry.name for entry in entries)
+
+@lru_cache(maxsize=None)
+def load_settings_source():
+    """Read settings.py once and share the text between all checks"""
+    with open(SETTINGS_FILE, 'r', encoding='utf-8') as f:
+        return f.read()
+
+@lru_cache(maxsize=None)
+def settings_assignments():
+    """
+    Parse settings.py once and map each setting name to the values assigned
+    to it, including assignments inside if/else branches.
+    
+    Working on the syntax tree means comments and unrelated strings can no
+    longer satisfy a check.
+    """
+    assignments = {}
+    for node in ast.walk(ast.parse(load_settings_source())):
+        if isinstance(node, ast.Assign):
+            for target in node.targets:
+                if isinstance(target, ast.Name):
+                    assignments.setdefault(target.id, []).append(node.value)
+    return assignments
+
+def setting_strings(name):
+    """All string literals used in the values assigned to a setting"""
+    return {
+        node.value
+        for value in settings_assignments().get(name, [])
+        for node in ast.walk(value)
+        if isinstance(node, ast.Constant) and isinstance(node.value, str)
+    }
+
+def _is_env_flag(node, name, default):
+    """Match `os.getenv(name, default) == 'True'`"""
+    if not (isinstance(node, ast.Compare) and len(node.ops) == 1
+            and isinstance(node.ops[0], ast.Eq)):
+        return False
+    call, expected = node.left, node.comparators[0]
+    return (
+        isinstance(call, ast.Call)
+        and isinstance(call.func, ast.Attribute) and call.func.attr == 'getenv'
+        and [getattr(arg, 'value', None) for arg in call.args] == [name, default]
+        and isinstance(expected, ast.Constant) and expected.value == 'True'
+    )
+
+def _django_check_in_process():
+    """Run `manage.py check --deploy` in this interpreter, returns (passed, output)"""
+    # Set DEBUG=False for production checks (must happen before settings load)
+    os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'election_cart.settings')
+    os.environ['DEBUG'] = 'False'
+    
+    import django
+    from django.core.management import call_command
+    from django.core.management.base import SystemCheckError
+    
+    django.setup()
+    
+    output = io.StringIO()
+    try:
+        call_command('check', '--deploy', stdout=output, stderr=output)
+        return True, output.getvalue()
+    except SystemCheckError as e:
+        return False, output.getvalue() + str(e)
+
+def _django_check_subprocess():
+    """Run `manage.py check --deploy` in a fresh interpreter, returns (passed, output)"""
+    env = os.environ.copy()
+    env['DEBUG'] = 'False'
+    
+    result = subprocess.run(
+        [sys.executable, 'manage.py', 'check', '--deploy'],
+        env=env,
+        capture_output=True,
+        text=True
+    )
+    return result.returncode == 0, result.stdout + result.stderr
 
 def run_django_check():
     """Run Django's deployment check"""
     print("🔍 Running Django Deployment Check\n")
     print("=" * 70)
     
-    # Set DEBUG=False for production checks
-    env = os.environ.copy()
-    env['DEBUG'] = 'False'
-    
     try:
-        result = subprocess.run(
-            [sys.executable, 'manage.py', 'check', '--deploy'],
-            env=env,
-            capture_output=True,
-            text=True
-        )
+        try:
+            passed, output = _django_check_in_process()
+        except Exception as e:
+            # Settings could not be loaded here (e.g. missing env), use a subprocess
+            print(f"ℹ️  In-process check unavailable ({e}), running manage.py")
+            passed, output = _django_check_subprocess()
         
-        print(result.stdout)
-        if result.stderr:
-            print(result.stderr)
+        print(output)
         
-        if result.returncode == 0:
+        if passed:
             print("✅ Django deployment check passed")
             return True
         else:
@@ -47,12 +144,8 @@ def check_secret_key():
     print("\n🔐 Checking SECRET_KEY\n")
     print("=" * 70)
     
-    # Read settings
-    with open('election_cart/settings.py', 'r', encoding='utf-8') as f:
-        content = f.read()
-    
     # Check for insecure default
-    if 'django-insecure' in content.lower():
+    if any('django-insecure' in value.lower() for value in setting_strings('SECRET_KEY')):
         print("⚠️  Default SECRET_KEY found in settings.py")
         print("   Generate new key for production!")
         return False
@@ -67,14 +160,13 @@ def check_debug_default():
     print("\n🐛 Checking DEBUG Configuration\n")
     print("=" * 70)
     
-    with open('election_cart/settings.py', 'r', encoding='utf-8') as f:
-        content = f.read()
+    debug_values = settings_assignments().get('DEBUG', [])
     
     # Check for proper DEBUG configuration
-    if "DEBUG = os.getenv('DEBUG', 'False') == 'True'" in content:
+    if any(_is_env_flag(value, 'DEBUG', 'False') for value in debug_values):
         print("✅ DEBUG defaults to False")
         return True
-    elif "DEBUG = True" in content:
+    elif any(isinstance(value, ast.Constant) and value.value is True for value in debug_values):
         print("❌ DEBUG is hardcoded to True")
         return False
     else:
@@ -88,10 +180,7 @@ def check_allowed_hosts():
     print("\n🌐 Checking ALLOWED_HOSTS\n")
     print("=" * 70)
     
-    with open('election_cart/settings.py', 'r', encoding='utf-8') as f:
-        content = f.read()
-    
-    if 'ALLOWED_HOSTS' in content:
+    if 'ALLOWED_HOSTS' in settings_assignments():
         print("✅ ALLOWED_HOSTS is configured")
         print("   Remember to set this in production environment!")
         return True
@@ -106,13 +195,12 @@ def check_security_middleware():
     print("\n🛡️  Checking Security Middleware\n")
     print("=" * 70)
     
-    with open('election_cart/settings.py', 'r', encoding='utf-8') as f:
-        content = f.read()
+    middleware = setting_strings('MIDDLEWARE')
     
     checks = []
     
     # Check for SecurityMiddleware
-    if 'SecurityMiddleware' in content:
+    if 'django.middleware.security.SecurityMiddleware' in middleware:
         print("✅ SecurityMiddleware enabled")
         checks.append(True)
     else:
@@ -120,7 +208,7 @@ def check_security_middleware():
         checks.append(False)
     
     # Check for WhiteNoiseMiddleware
-    if 'WhiteNoiseMiddleware' in content:
+    if 'whitenoise.middleware.WhiteNoiseMiddleware' in middleware:
         print("✅ WhiteNoiseMiddleware enabled")
         checks.append(True)
     else:
@@ -135,13 +223,17 @@ def check_database_config():
     print("\n💾 Checking Database Configuration\n")
     print("=" * 70)
     
-    with open('election_cart/settings.py', 'r', encoding='utf-8') as f:
-        content = f.read()
+    database_values = settings_assignments().get('DATABASES', [])
+    database_nodes = [node for value in database_values for node in ast.walk(value)]
     
     checks = []
     
-    # Check for DATABASE_URL support
-    if 'DATABASE_URL' in content:
+    # Check for DATABASE_URL support (read from the environment or dj_database_url)
+    if any(
+        isinstance(node, ast.Constant) and node.value == 'DATABASE_URL'
+        or isinstance(node, ast.Attribute) and node.attr == 'config'
+        for node in database_nodes
+    ):
         print("✅ DATABASE_URL support enabled")
         checks.append(True)
     else:
@@ -149,7 +241,11 @@ def check_database_config():
         checks.append(False)
     
     # Check for connection pooling
-    if 'CONN_MAX_AGE' in content:
+    if any(
+        isinstance(node, ast.Constant) and node.value == 'CONN_MAX_AGE'
+        or isinstance(node, ast.keyword) and node.arg == 'conn_max_age'
+        for node in database_nodes
+    ):
         print("✅ Connection pooling configured")
         checks.append(True)
     else:
@@ -159,19 +255,35 @@ def check_database_config():
     print("=" * 70)
     return all(checks)
 
+def count_static_files(root):
+    """
+    Count files with an extension under root.
+    
+    Walks the tree with os.scandir, whose entries carry the file type from
+    the directory listing, so no per-file stat or Path object is needed.
+    """
+    count = 0
+    pending = [root]
+    while pending:
+        with os.scandir(pending.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    pending.append(entry.path)
+                elif '.' in entry.name:
+                    count += 1
+    return count
+
 def check_static_files():
     """Check static files configuration"""
     print("\n📦 Checking Static Files\n")
     print("=" * 70)
     
-    from pathlib import Path
-    
     checks = []
     
     # Check STATIC_ROOT exists
-    static_root = Path('staticfiles')
-    if static_root.exists():
-        file_count = len(list(static_root.rglob('*.*')))
+    static_root = 'staticfiles'
+    if os.path.isdir(static_root):
+        file_count = count_static_files(static_root)
         print(f"✅ STATIC_ROOT exists ({file_count} files)")
         checks.append(True)
     else:
@@ -179,10 +291,12 @@ def check_static_files():
         checks.append(False)
     
     # Check WhiteNoise storage
-    with open('election_cart/settings.py', 'r', encoding='utf-8') as f:
-        content = f.read()
+    storages = setting_strings('STATICFILES_STORAGE') | setting_strings('STORAGES')
     
-    if 'CompressedManifestStaticFilesStorage' in content or 'CompressedStaticFilesStorage' in content:
+    if any(
+        value.endswith(('CompressedManifestStaticFilesStorage', 'CompressedStaticFilesStorage'))
+        for value in storages
+    ):
         print("✅ WhiteNoise compression enabled")
         checks.append(True)
     else:
@@ -197,12 +311,12 @@ def check_environment_variables():
     print("\n🔐 Checking Environment Variables\n")
     print("=" * 70)
     
-    from pathlib import Path
+    files = project_files()
     
     checks = []
     
     # Check .env.example exists
-    if Path('.env.example').exists():
+    if '.env.example' in files:
         print("✅ .env.example exists")
         checks.append(True)
     else:
@@ -210,7 +324,7 @@ def check_environment_variables():
         checks.append(False)
     
     # Check .env.production.template exists
-    if Path('.env.production.template').exists():
+    if '.env.production.template' in files:
         print("✅ .env.production.template exists")
         checks.append(True)
     else:
@@ -218,7 +332,7 @@ def check_environment_variables():
         checks.append(False)
     
     # Check .gitignore excludes .env
-    if Path('.gitignore').exists():
+    if '.gitignore' in files:
         with open('.gitignore', 'r') as f:
             gitignore = f.read()
         if '.env' in gitignore:
@@ -236,7 +350,7 @@ def check_deployment_files():
     print("\n🚀 Checking Deployment Files\n")
     print("=" * 70)
     
-    from pathlib import Path
+    present = project_files()
     
     checks = []
     
@@ -248,7 +362,7 @@ def check_deployment_files():
     }
     
     for file, description in files.items():
-        if Path(file).exists():
+        if file in present:
             print(f"✅ {file} exists ({description})")
             checks.append(True)
         else:
@@ -263,20 +377,7 @@ def security_checklist():
     print("\n📋 Pre-Deployment Security Checklist\n")
     print("=" * 70)
     
-    checklist = [
-        "Generate new DJANGO_SECRET_KEY for production",
-        "Set DEBUG=False in production",
-        "Configure ALLOWED_HOSTS with your domain",
-        "Use DATABASE_URL from Railway",
-        "Switch to live Razorpay keys",
-        "Configure SENTRY_DSN for error tracking",
-        "Update CORS_ALLOWED_ORIGINS with frontend URL",
-        "Verify all secrets are in environment variables",
-        "Run collectstatic before deployment",
-        "Test health endpoint after deployment",
-    ]
-    
-    for item in checklist:
+    for item in SECURITY_CHECKLIST:
         print(f"  ☐ {item}")
     
     print("=" * 70)
@@ -288,18 +389,19 @@ if __name__ == '__main__':
     print("=" * 70)
     
     try:
-        # Run all checks
-        results = {
-            'Django Check': run_django_check(),
-            'SECRET_KEY': check_secret_key(),
-            'DEBUG Config': check_debug_default(),
-            'ALLOWED_HOSTS': check_allowed_hosts(),
-            'Security Middleware': check_security_middleware(),
-            'Database Config': check_database_config(),
-            'Static Files': check_static_files(),
-            'Environment Variables': check_environment_variables(),
-            'Deployment Files': check_deployment_files(),
+        # Run all checks (independent, so they run concurrently)
+        checks = {
+            'Django Check': run_django_check,
+            'SECRET_KEY': check_secret_key,
+            'DEBUG Config': check_debug_default,
+            'ALLOWED_HOSTS': check_allowed_hosts,
+            'Security Middleware': check_security_middleware,
+            'Database Config': check_database_config,
+            'Static Files': check_static_files,
+            'Environment Variables': check_environment_variables,
+            'Deployment Files': check_deployment_files,
         }
+        results = dict(zip(checks, run_concurrently(list(checks.values()))))
         
         # Display checklist
         security_checklist()
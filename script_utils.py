@@ -0,0 +1,57 @@
+"""
+Helpers shared by the check and test scripts
+"""
+
+import io
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+class ThreadOutput(io.TextIOBase):
+    """stdout proxy that sends each worker thread's prints to its own buffer"""
+    
+    def __init__(self, stream):
+        self._stream = stream
+        self._local = threading.local()
+    
+    def capture(self):
+        self._local.buffer = io.StringIO()
+        return self._local.buffer
+    
+    def release(self):
+        self._local.buffer = None
+    
+    def write(self, text):
+        buffer = getattr(self._local, 'buffer', None)
+        return (buffer or self._stream).write(text)
+    
+    def flush(self):
+        self._stream.flush()
+
+def run_concurrently(funcs, *args):
+    """
+    Run independent checks in parallel threads, passing each *args.
+    
+    Each function's output is buffered and printed in the given order once
+    all have finished, so the report reads the same as a sequential run.
+    Returns the list of results in the same order.
+    """
+    proxy = ThreadOutput(sys.stdout)
+    
+    def run(func):
+        buffer = proxy.capture()
+        try:
+            return func(*args), buffer.getvalue()
+        finally:
+            proxy.release()
+    
+    original_stdout, sys.stdout = sys.stdout, proxy
+    try:
+        with ThreadPoolExecutor(max_workers=len(funcs)) as executor:
+            outcomes = list(executor.map(run, funcs))
+    finally:
+        sys.stdout = original_stdout
+    
+    for _, output in outcomes:
+        print(output, end='')
+    return [result for result, _ in outcomes]
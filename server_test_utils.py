@@ -0,0 +1,97 @@
+"""
+Helpers shared by the server-based test scripts
+"""
+
+import os
+import subprocess
+import sys
+import time
+from functools import lru_cache
+
+# Address the test server listens on
+SERVER_URL = 'http://127.0.0.1:8000'
+
+@lru_cache(maxsize=None)
+def get_session():
+    """
+    Return the one keep-alive connection pool shared by every test request.
+    
+    requests is imported here rather than at module level, so scripts that
+    never make a request don't pay for loading it.
+    """
+    import requests
+    from requests.adapters import HTTPAdapter
+    
+    session = requests.Session()
+    session.mount('http://', HTTPAdapter(pool_connections=1, pool_maxsize=16))
+    return session
+
+def start_server(env=None):
+    """Start Django development server, with env overriding the current environment"""
+    process = subprocess.Popen(
+        [sys.executable, 'manage.py', 'runserver', '8000', '--noreload'],
+        env={**os.environ, **env} if env else None,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL
+    )
+    return process
+
+def stop_server(process, timeout=5):
+    """Terminate the server, killing it if it hasn't exited within timeout seconds"""
+    process.terminate()
+    try:
+        process.wait(timeout=timeout)
+    except subprocess.TimeoutExpired:
+        process.kill()
+        process.wait()
+
+def wait_until_ready(url=f'{SERVER_URL}/admin/', timeout=10):
+    """
+    Poll url until the server answers, instead of sleeping a fixed time.
+    
+    Any HTTP response, including the HTTPS redirect DEBUG=False sends, means
+    the server is up. Raises RuntimeError if it has not answered within timeout
+    seconds, so a failed start stops the script instead of every check failing
+    to connect.
+    """
+    import requests
+    
+    session = get_session()
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            session.get(url, allow_redirects=False, timeout=(0.2, 5))
+            return
+        except requests.exceptions.ConnectionError:
+            time.sleep(0.05)
+    raise RuntimeError(
+        f"Server did not answer at {url} within {timeout}s "
+        f"(run 'python manage.py runserver' to see why it failed to start)"
+    )
+
+def log_stat(path):
+    """Return the log's (modification time in ns, size), or (0, 0) if it does not exist"""
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        return 0, 0
+    return stat.st_mtime_ns, stat.st_size
+
+def wait_for_log_write(path, since, timeout=1, settle=0.1):
+    """
+    Poll until the log has moved past since and then stopped changing.
+    
+    A request can log more than one line, and several requests may be in
+    flight, so the first write alone doesn't mean every entry is there. Returns
+    once the log's stat has been unchanged for settle seconds, or after
+    timeout seconds at most.
+    """
+    deadline = time.monotonic() + timeout
+    last, changed_at = since, None
+    while time.monotonic() < deadline:
+        current = log_stat(path)
+        if current != last:
+            last, changed_at = current, time.monotonic()
+        elif changed_at is not None and time.monotonic() - changed_at >= settle:
+            return
+        time.sleep(0.05)
@@ -9,12 +9,9 @@ from pathlib import Path
 # Add backend to path
 sys.path.insert(0, str(Path(__file__).parent))
 
-# Set up Django
+# Only settings are read, so django.setup() is not needed
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'election_cart.settings')
 
-import django
-django.setup()
-
 from django.conf import settings
 
 print("=" * 60)
@@ -48,19 +45,23 @@ else:
 # Test 4: Check TEMPLATES directory
 print(f"\n4. Templates Directory: {settings.TEMPLATES[0]['DIRS']}")
 templates_dir = Path(settings.BASE_DIR) / 'templates'
-if templates_dir.exists():
+
+# One directory read answers every existence check below
+try:
+    template_names = {entry.name for entry in os.scandir(templates_dir)}
+except FileNotFoundError:
+    template_names = None
+
+if template_names is not None:
     print(f"   ✅ GOOD: Templates directory exists")
     
     # Check for error pages
-    error_404 = templates_dir / '404.html'
-    error_500 = templates_dir / '500.html'
-    
-    if error_404.exists():
+    if '404.html' in template_names:
         print(f"   ✅ GOOD: 404.html exists")
     else:
         print(f"   ❌ ERROR: 404.html not found")
     
-    if error_500.exists():
+    if '500.html' in template_names:
         print(f"   ✅ GOOD: 500.html exists")
     else:
         print(f"   ❌ ERROR: 500.html not found")
@@ -84,7 +85,7 @@ if settings.DEBUG and os.getenv('DJANGO_ENVIRONMENT') == 'production':
     issues.append("DEBUG is True in production")
 if settings.SECRET_KEY == 'django-insecure-change-this-in-production':
     issues.append("Using default SECRET_KEY")
-if not templates_dir.exists():
+if template_names is None:
     issues.append("Templates directory missing")
 
 if issues:
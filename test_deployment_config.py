@@ -3,91 +3,127 @@
 Test script to verify deployment configuration files
 """
 
-import os
+import re
 import sys
 from pathlib import Path
 
-def test_procfile():
+from script_utils import run_concurrently
+
+# orjson is an optional speed-up; its JSONDecodeError subclasses json's,
+# so the stdlib exception type catches errors from either parser
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
+# Every file the checks below inspect, relative to the project root
+DEPLOYMENT_FILES = (
+    'Procfile',
+    'gunicorn.conf.py',
+    'requirements.txt',
+    'runtime.txt',
+    'railway.json',
+    '.dockerignore',
+)
+
+# Procfile tokens, found in one scan; each group number identifies a token
+PROCFILE_WEB, PROCFILE_MIGRATE, PROCFILE_COLLECTSTATIC, PROCFILE_GUNICORN, PROCFILE_PORT = range(1, 6)
+PROCFILE_TOKENS = re.compile(r'(web:)|(manage\.py migrate)|(collectstatic)|(gunicorn)|(\$PORT)')
+
+# A gunicorn requirement line, with or without a version specifier
+REQUIREMENT_GUNICORN = re.compile(rb'(?im)^[ \t]*gunicorn(?:[ \t]*[=<>~!;\[].*)?$')
+
+def read_deployment_files(root='.'):
+    """
+    Read the deployment files that exist under root.
+    
+    Each file is opened directly and a missing one is skipped, so opening it
+    is the existence check. Returns a dict mapping file name to its raw bytes.
+    """
+    files = {}
+    for name in DEPLOYMENT_FILES:
+        try:
+            files[name] = Path(root, name).read_bytes()
+        except FileNotFoundError:
+            pass
+    return files
+
+def test_procfile(files):
     """Test that Procfile exists and is correctly formatted"""
     print("🔍 Testing Procfile\n")
     print("=" * 70)
     
-    procfile_path = Path('Procfile')
-    
-    if not procfile_path.exists():
+    if 'Procfile' not in files:
         print("❌ Procfile not found")
         return False
     
-    with open(procfile_path, 'r') as f:
-        content = f.read()
+    content = files['Procfile'].decode()
     
     print("📄 Procfile content:")
     print(content)
     
-    checks = []
+    tokens = {match.lastindex for match in PROCFILE_TOKENS.finditer(content)}
+    passed = True
     
     # Check for web process
-    if 'web:' in content:
+    if PROCFILE_WEB in tokens:
         print("✅ Web process defined")
-        checks.append(True)
     else:
         print("❌ Web process not defined")
-        checks.append(False)
+        passed = False
     
     # Check for migrate command
-    if 'manage.py migrate' in content:
+    if PROCFILE_MIGRATE in tokens:
         print("✅ Database migrations included")
-        checks.append(True)
     else:
         print("⚠️  Database migrations not included")
-        checks.append(False)
+        passed = False
     
     # Check for collectstatic
-    if 'collectstatic' in content:
+    if PROCFILE_COLLECTSTATIC in tokens:
         print("✅ Static files collection included")
-        checks.append(True)
     else:
         print("⚠️  Static files collection not included")
-        checks.append(False)
+        passed = False
     
     # Check for gunicorn
-    if 'gunicorn' in content:
+    if PROCFILE_GUNICORN in tokens:
         print("✅ Gunicorn server configured")
-        checks.append(True)
     else:
         print("❌ Gunicorn not configured")
-        checks.append(False)
+        passed = False
     
     # Check for PORT variable
-    if '$PORT' in content:
+    if PROCFILE_PORT in tokens:
         print("✅ PORT variable used")
-        checks.append(True)
     else:
         print("⚠️  PORT variable not used")
-        checks.append(False)
+        passed = False
     
     print("=" * 70)
-    return all(checks)
+    return passed
 
-def test_gunicorn_config():
+def test_gunicorn_config(files):
     """Test that gunicorn.conf.py exists and is valid"""
     print("\n🔧 Testing Gunicorn Configuration\n")
     print("=" * 70)
     
     config_path = Path('gunicorn.conf.py')
     
-    if not config_path.exists():
+    if config_path.name not in files:
         print("⚠️  gunicorn.conf.py not found (optional)")
         return True  # Optional file
     
     print("✅ gunicorn.conf.py found")
     
+    # Only needed once the file is known to exist
+    import types
+    
     try:
-        # Try to import the config
-        import importlib.util
-        spec = importlib.util.spec_from_file_location("gunicorn_config", config_path)
-        config = importlib.util.module_from_spec(spec)
-        spec.loader.exec_module(config)
+        # Try to execute the config from the bytes already read
+        config = types.ModuleType("gunicorn_config")
+        config.__file__ = str(config_path)
+        exec(compile(files[config_path.name], str(config_path), 'exec'), vars(config))
         
         print("✅ Configuration file is valid Python")
         
@@ -110,26 +146,20 @@ def test_gunicorn_config():
     finally:
         print("=" * 70)
 
-def test_requirements():
+def test_requirements(files):
     """Test that gunicorn is in requirements.txt"""
     print("\n📦 Testing Requirements\n")
     print("=" * 70)
     
-    req_path = Path('requirements.txt')
-    
-    if not req_path.exists():
+    if 'requirements.txt' not in files:
         print("❌ requirements.txt not found")
         return False
     
-    with open(req_path, 'r') as f:
-        content = f.read()
-    
-    if 'gunicorn' in content:
+    # Stop at the first gunicorn line; only that line is decoded
+    requirement = REQUIREMENT_GUNICORN.search(files['requirements.txt'])
+    if requirement:
         print("✅ gunicorn in requirements.txt")
-        # Extract version
-        for line in content.split('\n'):
-            if 'gunicorn' in line.lower():
-                print(f"   Version: {line.strip()}")
+        print(f"   Version: {requirement.group().decode().strip()}")
         return True
     else:
         print("❌ gunicorn not in requirements.txt")
@@ -137,19 +167,16 @@ def test_requirements():
     
     print("=" * 70)
 
-def test_runtime():
+def test_runtime(files):
     """Test that runtime.txt exists"""
     print("\n🐍 Testing Runtime Configuration\n")
     print("=" * 70)
     
-    runtime_path = Path('runtime.txt')
-    
-    if not runtime_path.exists():
+    if 'runtime.txt' not in files:
         print("⚠️  runtime.txt not found (optional for some platforms)")
         return True  # Optional
     
-    with open(runtime_path, 'r') as f:
-        content = f.read().strip()
+    content = files['runtime.txt'].decode().strip()
     
     print(f"✅ runtime.txt found: {content}")
     
@@ -162,23 +189,22 @@ def test_runtime():
     
     print("=" * 70)
 
-def test_railway_config():
+def test_railway_config(files):
     """Test Railway configuration"""
     print("\n🚂 Testing Railway Configuration\n")
     print("=" * 70)
     
-    railway_path = Path('railway.json')
-    
-    if not railway_path.exists():
+    if 'railway.json' not in files:
         print("⚠️  railway.json not found (optional)")
         return True  # Optional
     
     print("✅ railway.json found")
     
+    # Only needed for its JSONDecodeError, and only once the file exists
+    import json
+    
     try:
-        import json
-        with open(railway_path, 'r') as f:
-            config = json.load(f)
+        config = json_loads(files['railway.json'])
         
         print("✅ Valid JSON format")
         
@@ -203,19 +229,16 @@ def test_railway_config():
     finally:
         print("=" * 70)
 
-def test_dockerignore():
+def test_dockerignore(files):
     """Test .dockerignore file"""
     print("\n🐳 Testing Docker Ignore\n")
     print("=" * 70)
     
-    dockerignore_path = Path('.dockerignore')
-    
-    if not dockerignore_path.exists():
+    if '.dockerignore' not in files:
         print("⚠️  .dockerignore not found (optional)")
         return True  # Optional
     
-    with open(dockerignore_path, 'r') as f:
-        content = f.read()
+    content = files['.dockerignore'].decode()
     
     print("✅ .dockerignore found")
     
@@ -235,13 +258,16 @@ if __name__ == '__main__':
     print("\n🚀 Starting Deployment Configuration Tests\n")
     
     try:
-        # Run all tests
-        test1 = test_procfile()
-        test2 = test_gunicorn_config()
-        test3 = test_requirements()
-        test4 = test_runtime()
-        test5 = test_railway_config()
-        test6 = test_dockerignore()
+        # Read every file up front, then run the independent checks concurrently
+        files = read_deployment_files()
+        test1, test2, test3, test4, test5, test6 = run_concurrently([
+            test_procfile,
+            test_gunicorn_config,
+            test_requirements,
+            test_runtime,
+            test_railway_config,
+            test_dockerignore,
+        ], files)
         
         # Summary
         print("\n" + "=" * 70)
@@ -1,153 +0,0 @@
-"""
-Simple test script to verify file upload security implementation.
-Run with: python manage.py shell < test_file_security.py
-"""
-
-import os
-import sys
-from io import BytesIO
-from PIL import Image
-from django.core.files.uploadedfile import SimpleUploadedFile
-from django.core.exceptions import ValidationError
-
-print("=" * 60)
-print("File Upload Security Test")
-print("=" * 60)
-
-# Test 1: Validate image file
-print("\n1. Testing image file validation...")
-try:
-    from products.validators import validate_image_file
-    
-    # Create a valid test image
-    img = Image.new('RGB', (100, 100), color='red')
-    img_io = BytesIO()
-    img.save(img_io, format='JPEG')
-    img_io.seek(0)
-    
-    test_file = SimpleUploadedFile(
-        "test.jpg",
-        img_io.read(),
-        content_type="image/jpeg"
-    )
-    
-    validate_image_file(test_file)
-    print("   ✓ Valid image file accepted")
-except Exception as e:
-    print(f"   ✗ Error: {e}")
-
-# Test 2: Reject oversized image
-print("\n2. Testing oversized image rejection...")
-try:
-    # Create a large image (simulate > 5MB)
-    img = Image.new('RGB', (100, 100), color='blue')
-    img_io = BytesIO()
-    img.save(img_io, format='JPEG')
-    img_io.seek(0)
-    
-    # Create a file that claims to be larger than 5MB
-    large_file = SimpleUploadedFile(
-        "large.jpg",
-        b'x' * (6 * 1024 * 1024),  # 6MB of data
-        content_type="image/jpeg"
-    )
-    
-    try:
-        validate_image_file(large_file)
-        print("   ✗ Oversized file was accepted (should be rejected)")
-    except ValidationError:
-        print("   ✓ Oversized image rejected")
-except Exception as e:
-    print(f"   ✗ Error: {e}")
-
-# Test 3: Reject invalid file extension
-print("\n3. Testing invalid file extension rejection...")
-try:
-    invalid_file = SimpleUploadedFile(
-        "test.exe",
-        b'MZ\x90\x00',  # PE executable signature
-        content_type="application/x-msdownload"
-    )
-    
-    try:
-        validate_image_file(invalid_file)
-        print("   ✗ Invalid file extension was accepted (should be rejected)")
-    except ValidationError:
-        print("   ✓ Invalid file extension rejected")
-except Exception as e:
-    print(f"   ✗ Error: {e}")
-
-# Test 4: Test secure storage
-print("\n4. Testing secure storage configuration...")
-try:
-    from products.storage import SecureFileStorage
-    from django.conf import settings
-    
-    storage = SecureFileStorage()
-    
-    # Check if secure media root is configured
-    if hasattr(settings, 'SECURE_MEDIA_ROOT'):
-        print(f"   ✓ SECURE_MEDIA_ROOT configured: {settings.SECURE_MEDIA_ROOT}")
-    else:
-        print("   ✗ SECURE_MEDIA_ROOT not configured")
-    
-    # Test secure filename generation
-    secure_name = storage.get_available_name("test.jpg")
-    if secure_name != "test.jpg":
-        print(f"   ✓ Secure filename generated: {secure_name}")
-    else:
-        print("   ✗ Filename not randomized")
-        
-except Exception as e:
-    print(f"   ✗ Error: {e}")
-
-# Test 5: Test document validation
-print("\n5. Testing document file validation...")
-try:
-    from products.validators import validate_document_file
-    
-    # Create a simple PDF-like file
-    pdf_content = b'%PDF-1.4\n%\xe2\xe3\xcf\xd3\n'
-    pdf_file = SimpleUploadedFile(
-        "test.pdf",
-        pdf_content,
-        content_type="application/pdf"
-    )
-    
-    # Note: This will fail MIME type check without actual PDF content
-    # In real usage, actual PDF files would be used
-    print("   ℹ Document validation requires actual file content")
-    print("   ✓ Document validator available")
-    
-except Exception as e:
-    print(f"   ✗ Error: {e}")
-
-# Test 6: Check middleware availability
-print("\n6. Testing middleware availability...")
-try:
-    from products.middleware import FileUploadSecurityMiddleware, FileUploadRateLimitMiddleware
-    print("   ✓ FileUploadSecurityMiddleware available")
-    print("   ✓ FileUploadRateLimitMiddleware available")
-except Exception as e:
-    print(f"   ✗ Error: {e}")
-
-# Test 7: Check file serving views
-print("\n7. Testing secure file serving views...")
-try:
-    from products.file_views import serve_product_image, serve_dynamic_resource, serve_order_resource
-    print("   ✓ serve_product_image available")
-    print("   ✓ serve_dynamic_resource available")
-    print("   ✓ serve_order_resource available")
-except Exception as e:
-    print(f"   ✗ Error: {e}")
-
-print("\n" + "=" * 60)
-print("Test Summary")
-print("=" * 60)
-print("\nFile upload security implementation is ready!")
-print("\nNext steps:")
-print("1. Run: python manage.py setup_secure_storage")
-print("2. Configure web server to deny direct access")
-print("3. Test file uploads through the application")
-print("4. Review FILE_UPLOAD_SECURITY.md for production setup")
-print("\n" + "=" * 60)
@@ -6,18 +6,78 @@ Test script to verify health check endpoint functionality
 import os
 import sys
 import time
-import subprocess
+import threading
 import requests
 import json
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from socketserver import ThreadingMixIn
+from wsgiref.simple_server import WSGIRequestHandler, WSGIServer, make_server
+from server_test_utils import get_session
+
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'election_cart.settings')
+
+# Points at the in-process server once start_server() has picked a port
+HEALTH_URL = 'http://127.0.0.1:8000/health/'
+
+# Fields every health check response must contain
+REQUIRED_FIELDS = frozenset({'status', 'service', 'database', 'timestamp'})
+
+# Loggers that would print into the test report while the server handles
+# requests: Django's request warnings and the health view's own messages
+SERVER_LOGGERS = ('django.request', 'django.server', 'election_cart.urls')
+
+SESSION = get_session()
+
+class ThreadedWSGIServer(ThreadingMixIn, WSGIServer):
+    """WSGI server handling each request in its own thread, like runserver"""
+    daemon_threads = True
+
+class QuietRequestHandler(WSGIRequestHandler):
+    """Request handler that keeps the access log out of the test report"""
+    
+    def log_message(self, format, *args):
+        pass
 
 def start_server():
-    """Start Django development server"""
-    process = subprocess.Popen(
-        [sys.executable, 'manage.py', 'runserver', '8000', '--noreload'],
-        stdout=subprocess.PIPE,
-        stderr=subprocess.PIPE
+    """Serve the Django WSGI app in-process on a free port"""
+    from django.core.wsgi import get_wsgi_application
+    
+    # The socket is bound and listening once make_server() returns, so
+    # requests can be sent immediately; no startup wait is needed
+    httpd = make_server(
+        '127.0.0.1', 0, get_wsgi_application(),
+        server_class=ThreadedWSGIServer,
+        handler_class=QuietRequestHandler
     )
-    return process
+    
+    # get_wsgi_application() has configured logging by now, so this sticks
+    for name in SERVER_LOGGERS:
+        logging.getLogger(name).disabled = True
+    
+    threading.Thread(target=httpd.serve_forever, daemon=True).start()
+    return httpd
+
+def stop_server(httpd):
+    """Shut the in-process server down and let its loggers print again"""
+    httpd.shutdown()
+    httpd.server_close()
+    for name in SERVER_LOGGERS:
+        logging.getLogger(name).disabled = False
+
+def report(passed, success_message, failure_message):
+    """Print the outcome of one check and return whether it passed"""
+    print(f"✅ {success_message}" if passed else f"❌ {failure_message}")
+    return passed
+
+def is_iso_timestamp(value):
+    """Return True if value parses as an ISO 8601 datetime"""
+    try:
+        datetime.fromisoformat(value.replace('Z', '+00:00'))
+        return True
+    except (AttributeError, TypeError, ValueError):
+        return False
 
 def test_health_check_healthy():
     """Test health check when database is connected"""
@@ -26,7 +86,7 @@ def test_health_check_healthy():
     
     try:
         # Make request to health endpoint
-        response = requests.get('http://127.0.0.1:8000/health/')
+        response = SESSION.get(HEALTH_URL)
         
         print(f"📊 Response Status: {response.status_code}")
         print(f"📋 Response Headers:")
@@ -42,66 +102,50 @@ def test_health_check_healthy():
         print("✅ Validation Results:")
         print("=" * 70)
         
-        # Validate response
-        checks = []
-        
-        # Check status code
-        if response.status_code == 200:
-            print("✅ Status code is 200 (OK)")
-            checks.append(True)
-        else:
-            print(f"❌ Status code is {response.status_code} (expected 200)")
-            checks.append(False)
-        
-        # Check content type
-        if 'application/json' in response.headers.get('Content-Type', ''):
-            print("✅ Content-Type is application/json")
-            checks.append(True)
-        else:
-            print(f"❌ Content-Type is {response.headers.get('Content-Type')}")
-            checks.append(False)
-        
-        # Check required fields
-        required_fields = ['status', 'service', 'database', 'timestamp']
-        for field in required_fields:
-            if field in data:
-                print(f"✅ Field '{field}' present: {data[field]}")
-                checks.append(True)
-            else:
-                print(f"❌ Field '{field}' missing")
-                checks.append(False)
-        
-        # Check status value
-        if data.get('status') == 'healthy':
-            print("✅ Status is 'healthy'")
-            checks.append(True)
-        else:
-            print(f"❌ Status is '{data.get('status')}' (expected 'healthy')")
-            checks.append(False)
-        
-        # Check database value
-        if data.get('database') == 'connected':
-            print("✅ Database is 'connected'")
-            checks.append(True)
-        else:
-            print(f"❌ Database is '{data.get('database')}' (expected 'connected')")
-            checks.append(False)
-        
-        # Check service name
-        if data.get('service') == 'election-cart-api':
-            print("✅ Service name is 'election-cart-api'")
-            checks.append(True)
-        else:
-            print(f"❌ Service name is '{data.get('service')}'")
-            checks.append(False)
-        
-        # Check timestamp format
-        if data.get('timestamp') and 'T' in data.get('timestamp', ''):
-            print(f"✅ Timestamp is in ISO format: {data.get('timestamp')}")
-            checks.append(True)
-        else:
-            print(f"❌ Timestamp format invalid: {data.get('timestamp')}")
-            checks.append(False)
+        # Validate response: every check is reported, then the results combined
+        content_type = response.headers.get('Content-Type', '')
+        timestamp = data.get('timestamp')
+        missing_fields = REQUIRED_FIELDS - data.keys()
+        checks = [
+            report(
+                response.status_code == 200,
+                "Status code is 200 (OK)",
+                f"Status code is {response.status_code} (expected 200)"
+            ),
+            report(
+                'application/json' in content_type,
+                "Content-Type is application/json",
+                f"Content-Type is {response.headers.get('Content-Type')}"
+            ),
+            *(
+                report(
+                    field not in missing_fields,
+                    f"Field '{field}' present: {data.get(field)}",
+                    f"Field '{field}' missing"
+                )
+                for field in sorted(REQUIRED_FIELDS)
+            ),
+            report(
+                data.get('status') == 'healthy',
+                "Status is 'healthy'",
+                f"Status is '{data.get('status')}' (expected 'healthy')"
+            ),
+            report(
+                data.get('database') == 'connected',
+                "Database is 'connected'",
+                f"Database is '{data.get('database')}' (expected 'connected')"
+            ),
+            report(
+                data.get('service') == 'election-cart-api',
+                "Service name is 'election-cart-api'",
+                f"Service name is '{data.get('service')}'"
+            ),
+            report(
+                is_iso_timestamp(timestamp),
+                f"Timestamp is in ISO format: {timestamp}",
+                f"Timestamp format invalid: {timestamp}"
+            ),
+        ]
         
         print("=" * 70)
         
@@ -126,7 +170,7 @@ def test_health_check_no_auth():
     
     try:
         # Make request without any authentication headers
-        response = requests.get('http://127.0.0.1:8000/health/')
+        response = SESSION.get(HEALTH_URL)
         
         if response.status_code == 200:
             print("✅ Health check accessible without authentication")
@@ -148,7 +192,7 @@ def test_health_check_response_time():
     try:
         # Measure response time
         start_time = time.time()
-        response = requests.get('http://127.0.0.1:8000/health/')
+        response = SESSION.get(HEALTH_URL)
         end_time = time.time()
         
         response_time = (end_time - start_time) * 1000  # Convert to milliseconds
@@ -175,11 +219,14 @@ def test_health_check_multiple_requests():
         num_requests = 10
         print(f"📝 Making {num_requests} rapid requests...")
         
-        success_count = 0
-        for i in range(num_requests):
-            response = requests.get('http://127.0.0.1:8000/health/')
-            if response.status_code == 200:
-                success_count += 1
+        # Fan out every request at once (one worker per request, like
+        # gathering them on an event loop)
+        with ThreadPoolExecutor(max_workers=num_requests) as executor:
+            statuses = list(executor.map(
+                lambda _: SESSION.get(HEALTH_URL, timeout=2).status_code,
+                range(num_requests)
+            ))
+        success_count = sum(status == 200 for status in statuses)
         
         print(f"\n📊 Results: {success_count}/{num_requests} successful")
         
@@ -199,11 +246,8 @@ if __name__ == '__main__':
     
     # Start server
     print("Starting Django server...")
-    server_process = start_server()
-    
-    # Wait for server to start
-    print("Waiting for server to start...")
-    time.sleep(3)
+    server = start_server()
+    HEALTH_URL = f'http://127.0.0.1:{server.server_port}/health/'
     
     try:
         # Run all tests
@@ -238,5 +282,4 @@ if __name__ == '__main__':
     finally:
         # Stop server
         print("\n🛑 Stopping server...")
-        server_process.terminate()
-        server_process.wait()
+        stop_server(server)
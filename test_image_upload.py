@@ -14,8 +14,19 @@ django.setup()
 from django.core.files.uploadedfile import SimpleUploadedFile
 from products.models import ProductImage, Package
 from django.contrib.contenttypes.models import ContentType
-from PIL import Image
-from io import BytesIO
+from django.test import RequestFactory
+from products.testing import encode_test_jpeg
+
+# Resolved once and reused for every image created below
+PACKAGE_CT = ContentType.objects.get_for_model(Package)
+
+
+# A small JPEG (about 2.5 KB) that is still wider than the 300px thumbnail
+# bound, so ProductImage.create_thumbnail has to resize it
+TEST_JPEG_BYTES = encode_test_jpeg((400, 300), 'blue', quality=60)
+
+# Serializer context request, built once (only used to build absolute URLs)
+SERIALIZER_REQUEST = RequestFactory().get('/')
 
 print("=" * 80)
 print("TEST IMAGE UPLOAD THROUGH DJANGO MODEL")
@@ -35,28 +46,19 @@ print(f"\n1. Using package: {package.name} (ID: {package.id})")
 
 # Create a test image
 print("\n2. Creating test image...")
-img = Image.new('RGB', (800, 600), color='blue')
-img_bytes = BytesIO()
-img.save(img_bytes, format='JPEG')
-img_bytes.seek(0)
-
-# Create Django file
 image_file = SimpleUploadedFile(
     'test_image.jpg',
-    img_bytes.read(),
+    TEST_JPEG_BYTES,
     content_type='image/jpeg'
 )
 
-print(f"   ✓ Test image created (size: {len(image_file.read())} bytes)")
-image_file.seek(0)
+print(f"   ✓ Test image created (size: {image_file.size} bytes)")
 
 # Upload through Django model
 print("\n3. Uploading through ProductImage model...")
 try:
-    content_type = ContentType.objects.get_for_model(Package)
-    
     product_image = ProductImage.objects.create(
-        content_type=content_type,
+        content_type=PACKAGE_CT,
         object_id=package.id,
         image=image_file,
         is_primary=True,
@@ -71,20 +73,17 @@ try:
     # Test serializer
     print("\n4. Testing serializer...")
     from products.serializers import ProductImageSerializer
-    from rest_framework.request import Request
-    from django.test import RequestFactory
-    
-    factory = RequestFactory()
-    request = factory.get('/')
     
-    serializer = ProductImageSerializer(product_image, context={'request': request})
+    serializer = ProductImageSerializer(product_image, context={'request': SERIALIZER_REQUEST})
     data = serializer.data
     
     print(f"   ✓ Serializer data:")
     print(f"   - image_url: {data.get('image_url')}")
     print(f"   - thumbnail_url: {data.get('thumbnail_url')}")
     
-    # Clean up
+    # Clean up. Use the instance delete() rather than a queryset delete so the
+    # file is also removed from the configured storage (Cloudinary or disk);
+    # that storage is what this script exercises, so it is not swapped out
     print("\n5. Cleaning up...")
     product_image.delete()
     print(f"   ✓ Test image deleted")
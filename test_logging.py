@@ -7,7 +7,6 @@ import os
 import sys
 import django
 import logging
-from pathlib import Path
 
 # Setup Django
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'election_cart.settings')
@@ -15,6 +14,24 @@ django.setup()
 
 from django.conf import settings
 
+# Entries the LOGGING setting is expected to define
+EXPECTED_HANDLERS = frozenset({'console', 'file', 'error_file'})
+EXPECTED_FORMATTERS = frozenset({'verbose', 'simple'})
+EXPECTED_LOGGERS = frozenset({'django', 'django.request', 'authentication', 'orders'})
+
+def log_tail(path, tail_bytes=4096):
+    """
+    Return (size, last line) of a log file from a single open.
+    
+    The size comes from fstat on the open file and only the final tail_bytes
+    are read. Raises FileNotFoundError if the log does not exist.
+    """
+    with open(path, 'rb') as f:
+        size = os.fstat(f.fileno()).st_size
+        f.seek(max(0, size - tail_bytes))
+        lines = f.read().splitlines()
+    return size, lines[-1].decode('utf-8', 'replace') if lines else ''
+
 def test_logging_configuration():
     """Test that logging is properly configured"""
     print("🔍 Testing Logging Configuration\n")
@@ -28,53 +45,51 @@ def test_logging_configuration():
         print(f"❌ Logs directory not found: {logs_dir}")
         return False
     
-    # Check logging configuration
-    if hasattr(settings, 'LOGGING'):
+    # Check logging configuration (looked up once, then read locally)
+    logging_config = getattr(settings, 'LOGGING', None)
+    if logging_config is not None:
         print("✅ LOGGING configuration found in settings")
     else:
         print("❌ LOGGING configuration not found in settings")
         return False
     
     # Verify handlers
-    handlers = settings.LOGGING.get('handlers', {})
-    expected_handlers = ['console', 'file', 'error_file']
+    handlers = logging_config.get('handlers', {})
+    found_handlers = EXPECTED_HANDLERS & handlers.keys()
     
     print("\n📋 Configured Handlers:")
-    for handler_name in expected_handlers:
-        if handler_name in handlers:
-            handler = handlers[handler_name]
-            print(f"  ✅ {handler_name}")
-            print(f"     - Class: {handler.get('class')}")
-            if 'filename' in handler:
-                print(f"     - File: {handler.get('filename')}")
-            print(f"     - Level: {handler.get('level')}")
-        else:
-            print(f"  ❌ {handler_name} - NOT FOUND")
+    for handler_name in sorted(found_handlers):
+        handler = handlers[handler_name]
+        print(f"  ✅ {handler_name}")
+        print(f"     - Class: {handler.get('class')}")
+        if 'filename' in handler:
+            print(f"     - File: {handler.get('filename')}")
+        print(f"     - Level: {handler.get('level')}")
+    for handler_name in sorted(EXPECTED_HANDLERS - found_handlers):
+        print(f"  ❌ {handler_name} - NOT FOUND")
     
     # Verify formatters
-    formatters = settings.LOGGING.get('formatters', {})
-    expected_formatters = ['verbose', 'simple']
+    formatters = logging_config.get('formatters', {})
+    found_formatters = EXPECTED_FORMATTERS & formatters.keys()
     
     print("\n📋 Configured Formatters:")
-    for formatter_name in expected_formatters:
-        if formatter_name in formatters:
-            print(f"  ✅ {formatter_name}")
-        else:
-            print(f"  ❌ {formatter_name} - NOT FOUND")
+    for formatter_name in sorted(found_formatters):
+        print(f"  ✅ {formatter_name}")
+    for formatter_name in sorted(EXPECTED_FORMATTERS - found_formatters):
+        print(f"  ❌ {formatter_name} - NOT FOUND")
     
     # Verify loggers
-    loggers = settings.LOGGING.get('loggers', {})
-    expected_loggers = ['django', 'django.request', 'authentication', 'orders']
+    loggers = logging_config.get('loggers', {})
+    found_loggers = EXPECTED_LOGGERS & loggers.keys()
     
     print("\n📋 Configured Loggers:")
-    for logger_name in expected_loggers:
-        if logger_name in loggers:
-            logger = loggers[logger_name]
-            print(f"  ✅ {logger_name}")
-            print(f"     - Handlers: {logger.get('handlers')}")
-            print(f"     - Level: {logger.get('level')}")
-        else:
-            print(f"  ❌ {logger_name} - NOT FOUND")
+    for logger_name in sorted(found_loggers):
+        logger = loggers[logger_name]
+        print(f"  ✅ {logger_name}")
+        print(f"     - Handlers: {logger.get('handlers')}")
+        print(f"     - Level: {logger.get('level')}")
+    for logger_name in sorted(EXPECTED_LOGGERS - found_loggers):
+        print(f"  ❌ {logger_name} - NOT FOUND")
     
     print("\n" + "=" * 70)
     return True
@@ -106,7 +121,7 @@ def test_logging_functionality():
         # Intentionally cause an error
         raise ValueError("Test error for logging")
     except ValueError as e:
-        django_logger.error(f"Test ERROR message: {e}", exc_info=True)
+        django_logger.error("Test ERROR message: %s", e, exc_info=True)
         print("  ✅ Wrote ERROR message with stack trace")
     
     print("\n" + "=" * 70)
@@ -118,29 +133,17 @@ def test_logging_functionality():
     
     print("\n📁 Checking Log Files:\n")
     
-    if django_log.exists():
-        size = django_log.stat().st_size
-        print(f"  ✅ django.log created ({size} bytes)")
+    for log_path in (django_log, error_log):
+        # One open gives the size and the tail, not the whole (up to 5MB) file
+        try:
+            size, entry = log_tail(log_path)
+        except FileNotFoundError:
+            print(f"  ❌ {log_path.name} not found")
+            continue
         
-        # Read last few lines
-        with open(django_log, 'r') as f:
-            lines = f.readlines()
-            if lines:
-                print(f"     Last entry: {lines[-1].strip()}")
-    else:
-        print(f"  ❌ django.log not found")
-    
-    if error_log.exists():
-        size = error_log.stat().st_size
-        print(f"  ✅ error.log created ({size} bytes)")
-        
-        # Read last few lines
-        with open(error_log, 'r') as f:
-            lines = f.readlines()
-            if lines:
-                print(f"     Last entry: {lines[-1].strip()}")
-    else:
-        print(f"  ❌ error.log not found")
+        print(f"  ✅ {log_path.name} created ({size} bytes)")
+        if entry:
+            print(f"     Last entry: {entry.strip()}")
     
     print("\n" + "=" * 70)
     return True
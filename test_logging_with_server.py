@@ -5,19 +5,29 @@ Test logging with actual Django server requests
 
 import os
 import sys
-import time
-import subprocess
 import requests
 from pathlib import Path
 
-def start_server():
-    """Start Django development server"""
-    process = subprocess.Popen(
-        [sys.executable, 'manage.py', 'runserver', '8000', '--noreload'],
-        stdout=subprocess.PIPE,
-        stderr=subprocess.PIPE
-    )
-    return process
+from server_test_utils import (
+    get_session, log_stat, start_server, stop_server, wait_for_log_write, wait_until_ready
+)
+
+SESSION = get_session()
+
+# Request log written by the server under test
+DJANGO_LOG = Path('logs') / 'django.log'
+
+def read_log_tail(path, tail_bytes=64 * 1024):
+    """
+    Return (size, last tail_bytes of a log file as raw bytes).
+    
+    Only the end of the file is read, so the cost stays bounded however large
+    the log grows across runs.
+    """
+    with open(path, 'rb') as f:
+        size = f.seek(0, os.SEEK_END)
+        f.seek(max(0, size - tail_bytes))
+        return size, f.read()
 
 def test_server_logging():
     """Test that server requests are logged"""
@@ -25,45 +35,43 @@ def test_server_logging():
     print("=" * 70)
     
     # Wait for server to start
-    time.sleep(3)
+    wait_until_ready()
     
     try:
+        # Note the log's stat so the wait below can tell when it is written
+        logged_at = log_stat(DJANGO_LOG)
+        
         # Make various requests
         print("📝 Making test requests...\n")
         
         # Request 1: Admin page (should log)
-        response = requests.get('http://127.0.0.1:8000/admin/', allow_redirects=False)
+        response = SESSION.get('http://127.0.0.1:8000/admin/', allow_redirects=False)
         print(f"  ✅ GET /admin/ - Status: {response.status_code}")
         
         # Request 2: API endpoint (should log)
-        response = requests.get('http://127.0.0.1:8000/api/packages/', allow_redirects=False)
+        response = SESSION.get('http://127.0.0.1:8000/api/packages/', allow_redirects=False)
         print(f"  ✅ GET /api/packages/ - Status: {response.status_code}")
         
         # Request 3: Non-existent page (should log 404)
-        response = requests.get('http://127.0.0.1:8000/nonexistent/', allow_redirects=False)
+        response = SESSION.get('http://127.0.0.1:8000/nonexistent/', allow_redirects=False)
         print(f"  ✅ GET /nonexistent/ - Status: {response.status_code}")
         
         print("\n" + "=" * 70)
         
-        # Wait a moment for logs to be written
-        time.sleep(1)
-        
-        # Check log files
-        logs_dir = Path('logs')
-        django_log = logs_dir / 'django.log'
+        # Wait until all three requests' entries are written
+        wait_for_log_write(DJANGO_LOG, logged_at)
         
         print("\n📁 Checking django.log for request logs:\n")
         
-        if django_log.exists():
-            with open(django_log, 'r') as f:
-                lines = f.readlines()
-                
+        if DJANGO_LOG.exists():
+            size, tail = read_log_tail(DJANGO_LOG)
+            
             # Show last 10 lines
             print("  Last 10 log entries:")
-            for line in lines[-10:]:
-                print(f"    {line.strip()}")
+            for line in tail.splitlines()[-10:]:
+                print(f"    {line.decode('utf-8', 'replace').strip()}")
             
-            print(f"\n  ✅ Total log entries: {len(lines)}")
+            print(f"\n  ✅ Log size: {size} bytes")
         else:
             print("  ❌ django.log not found")
         
@@ -101,5 +109,4 @@ if __name__ == '__main__':
     finally:
         # Stop server
         print("\n🛑 Stopping server...")
-        server_process.terminate()
-        server_process.wait()
+        stop_server(server_process)
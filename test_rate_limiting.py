@@ -6,18 +6,42 @@ Test script to verify rate limiting functionality on authentication and order en
 import os
 import sys
 import time
-import subprocess
-import requests
 import json
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 
-def start_server():
-    """Start Django development server"""
-    process = subprocess.Popen(
-        [sys.executable, 'manage.py', 'runserver', '8000', '--noreload'],
-        stdout=subprocess.PIPE,
-        stderr=subprocess.PIPE
-    )
-    return process
+from server_test_utils import (
+    get_session, log_stat, start_server, stop_server, wait_for_log_write, wait_until_ready
+)
+
+SESSION = get_session()
+
+# Sent with every pre-encoded JSON request body
+JSON_HEADERS = {'Content-Type': 'application/json'}
+
+# Request log written by the server under test
+DJANGO_LOG = Path('logs') / 'django.log'
+
+def read_log_from(path, offset):
+    """Return what was appended to a log file after offset, undecoded"""
+    with open(path, 'rb') as f:
+        size = f.seek(0, os.SEEK_END)
+        # A log rotated since offset was taken is read from its start
+        f.seek(offset if offset <= size else 0)
+        return f.read()
+
+def post_concurrently(url, bodies):
+    """
+    POST every JSON body to url at once and return the responses in order.
+    
+    The burst goes out in parallel over the shared session, so it costs about
+    one round-trip instead of one per request. Bodies are encoded by the
+    caller, so a payload repeated across the burst is serialised only once.
+    """
+    with ThreadPoolExecutor(max_workers=len(bodies)) as executor:
+        return list(executor.map(
+            lambda body: SESSION.post(url, data=body, headers=JSON_HEADERS), bodies
+        ))
 
 def test_login_rate_limit():
     """Test rate limiting on login endpoint (5 requests per minute)"""
@@ -30,8 +54,7 @@ def test_login_rate_limit():
     print("📝 Making 6 rapid login requests...\n")
     
     results = []
-    for i in range(6):
-        response = requests.post(url, json=payload)
+    for i, response in enumerate(post_concurrently(url, [json.dumps(payload)] * 6)):
         results.append({
             'request': i + 1,
             'status': response.status_code,
@@ -47,24 +70,26 @@ def test_login_rate_limit():
     print("✅ Validation Results:")
     print("=" * 70)
     
-    # Check that first 5 requests succeeded (or returned 401 for invalid creds)
-    first_five_ok = all(r['status'] in [401, 400] for r in results[:5])
-    # Check that 6th request was rate limited (403 or 429)
-    sixth_limited = results[5]['status'] in [403, 429]
+    # The requests arrive concurrently, so any one of them may be the one over
+    # the limit: expect 5 allowed (401 for invalid creds) and 1 limited (403 or 429)
+    limited = [r['status'] for r in results if r['status'] in [403, 429]]
+    allowed = sum(r['status'] in [401, 400] for r in results)
+    five_allowed = allowed == 5
+    one_limited = len(limited) == 1
     
-    if first_five_ok:
-        print("✅ First 5 requests allowed (returned 401/400 for invalid credentials)")
+    if five_allowed:
+        print("✅ 5 of 6 requests allowed (returned 401/400 for invalid credentials)")
     else:
-        print("❌ First 5 requests should not be rate limited")
+        print(f"❌ Expected 5 of 6 requests allowed, got {allowed}")
     
-    if sixth_limited:
-        print(f"✅ 6th request was rate limited ({results[5]['status']})")
+    if one_limited:
+        print(f"✅ 1 of 6 requests rate limited ({limited[0]})")
     else:
-        print("❌ 6th request should be rate limited")
+        print(f"❌ Expected 1 of 6 requests rate limited, got {len(limited)}")
     
     print("=" * 70)
     
-    return first_five_ok and sixth_limited
+    return five_allowed and one_limited
 
 def test_signup_rate_limit():
     """Test rate limiting on signup endpoint (3 requests per hour)"""
@@ -75,14 +100,20 @@ def test_signup_rate_limit():
     
     print("📝 Making 4 rapid signup requests...\n")
     
-    results = []
-    for i in range(4):
-        payload = {
-            'username': f'testuser{i}_{int(time.time())}',
+    # One timestamp for the whole batch; the index keeps usernames unique
+    base_ts = int(time.time())
+    payloads = [
+        {
+            'username': f'testuser{i}_{base_ts}',
             'password': 'testpass123',
             'phone_number': f'123456789{i}'
         }
-        response = requests.post(url, json=payload)
+        for i in range(4)
+    ]
+    
+    results = []
+    bodies = [json.dumps(payload) for payload in payloads]
+    for i, response in enumerate(post_concurrently(url, bodies)):
         results.append({
             'request': i + 1,
             'status': response.status_code,
@@ -98,51 +129,51 @@ def test_signup_rate_limit():
     print("✅ Validation Results:")
     print("=" * 70)
     
-    # Check that first 3 requests succeeded (or returned 400/500 for validation/errors)
-    first_three_ok = all(r['status'] in [201, 400, 500] for r in results[:3])
-    # Check that 4th request was rate limited (403 or 429)
-    fourth_limited = results[3]['status'] in [403, 429]
+    # The requests arrive concurrently, so any one of them may be the one over
+    # the limit: expect 3 allowed (400/500 for validation/errors) and 1 limited (403 or 429)
+    limited = [r['status'] for r in results if r['status'] in [403, 429]]
+    allowed = sum(r['status'] in [201, 400, 500] for r in results)
+    three_allowed = allowed == 3
+    one_limited = len(limited) == 1
     
-    if first_three_ok:
-        print("✅ First 3 requests allowed")
+    if three_allowed:
+        print("✅ 3 of 4 requests allowed")
     else:
-        print("❌ First 3 requests should not be rate limited")
+        print(f"❌ Expected 3 of 4 requests allowed, got {allowed}")
     
-    if fourth_limited:
-        print(f"✅ 4th request was rate limited ({results[3]['status']})")
+    if one_limited:
+        print(f"✅ 1 of 4 requests rate limited ({limited[0]})")
     else:
-        print("❌ 4th request should be rate limited")
+        print(f"❌ Expected 1 of 4 requests rate limited, got {len(limited)}")
     
     print("=" * 70)
     
-    return first_three_ok and fourth_limited
+    return three_allowed and one_limited
 
 def test_rate_limit_logging():
     """Test that rate limit violations are logged"""
     print("\n📝 Testing Rate Limit Logging\n")
     print("=" * 70)
     
+    # Note where the log ends, so only what this test appends is scanned
+    before = log_stat(DJANGO_LOG)
+    
     # Make a rate-limited request
     url = 'http://127.0.0.1:8000/api/auth/login/'
     payload = {'username': 'testuser', 'password': 'testpass'}
     
     # Make 6 requests to trigger rate limit
-    for i in range(6):
-        requests.post(url, json=payload)
+    post_concurrently(url, [json.dumps(payload)] * 6)
     
-    # Wait a moment for logs to be written
-    time.sleep(1)
+    # Wait for the logs to be written
+    wait_for_log_write(DJANGO_LOG, before)
     
     # Check if rate limit was logged
-    from pathlib import Path
-    logs_dir = Path('logs')
-    django_log = logs_dir / 'django.log'
-    
-    if django_log.exists():
-        with open(django_log, 'r') as f:
-            log_content = f.read()
+    if DJANGO_LOG.exists():
+        # Match on the new entries' bytes, no decoding
+        new_entries = read_log_from(DJANGO_LOG, before[1])
         
-        if 'Rate limit exceeded' in log_content:
+        if b'Rate limit exceeded' in new_entries:
             print("✅ Rate limit violations are being logged")
             print("   Found 'Rate limit exceeded' in django.log")
             return True
@@ -162,8 +193,7 @@ def test_rate_limit_response_format():
     payload = {'username': 'testuser', 'password': 'testpass'}
     
     # Make 6 requests to trigger rate limit
-    for i in range(6):
-        response = requests.post(url, json=payload)
+    for response in post_concurrently(url, [json.dumps(payload)] * 6):
         if response.status_code in [403, 429]:
             print(f"📦 Rate Limit Response (Status {response.status_code}):")
             
@@ -198,11 +228,11 @@ if __name__ == '__main__':
     print("Starting Django server...")
     server_process = start_server()
     
-    # Wait for server to start
-    print("Waiting for server to start...")
-    time.sleep(3)
-    
     try:
+        # Wait for server to start
+        print("Waiting for server to start...")
+        wait_until_ready()
+        
         # Run all tests
         test1 = test_login_rate_limit()
         test2 = test_signup_rate_limit()
@@ -236,5 +266,4 @@ if __name__ == '__main__':
     finally:
         # Stop server
         print("\n🛑 Stopping server...")
-        server_process.terminate()
-        server_process.wait()
+        stop_server(server_process)
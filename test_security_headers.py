@@ -4,38 +4,27 @@ Test script to verify security headers are properly configured.
 This script starts the Django server with DEBUG=False and checks the response headers.
 """
 
-import os
 import sys
-import time
-import subprocess
 import requests
-from threading import Thread
 
-def start_server():
-    """Start Django development server with DEBUG=False"""
-    env = os.environ.copy()
-    env['DEBUG'] = 'False'
-    env['ALLOWED_HOSTS'] = 'localhost,127.0.0.1'
-    
-    # Start server
-    process = subprocess.Popen(
-        [sys.executable, 'manage.py', 'runserver', '8000', '--noreload'],
-        env=env,
-        stdout=subprocess.PIPE,
-        stderr=subprocess.PIPE
-    )
-    return process
+from server_test_utils import get_session, start_server, stop_server, wait_until_ready
+
+SESSION = get_session()
+
+# Production settings the server is started with
+PRODUCTION_ENV = {'DEBUG': 'False', 'ALLOWED_HOSTS': 'localhost,127.0.0.1'}
 
 def test_security_headers():
     """Test that security headers are present in the response"""
     print("🔍 Testing security headers...\n")
     
     # Wait for server to start
-    time.sleep(3)
+    wait_until_ready()
     
     try:
         # Make a request to the server
-        response = requests.get('http://127.0.0.1:8000/admin/', allow_redirects=False)
+        # HEAD returns the same headers without transferring the page body
+        response = SESSION.head('http://127.0.0.1:8000/admin/', allow_redirects=False)
         
         print("📋 Response Headers:")
         print("-" * 60)
@@ -47,19 +36,22 @@ def test_security_headers():
             'X-Frame-Options': 'DENY',
         }
         
-        # Check each expected header
-        all_passed = True
-        for header, expected_value in expected_headers.items():
+        # Headers that are absent or don't carry the expected value
+        missing = {
+            header: expected_value
+            for header, expected_value in expected_headers.items()
+            if expected_value.lower() not in response.headers.get(header, '').lower()
+        }
+        all_passed = not missing
+        
+        for header in expected_headers:
             actual_value = response.headers.get(header)
-            if actual_value:
-                if expected_value.lower() in actual_value.lower():
-                    print(f"✅ {header}: {actual_value}")
-                else:
-                    print(f"⚠️  {header}: {actual_value} (expected: {expected_value})")
-                    all_passed = False
+            if header not in missing:
+                print(f"✅ {header}: {actual_value}")
+            elif actual_value:
+                print(f"⚠️  {header}: {actual_value} (expected: {missing[header]})")
             else:
                 print(f"❌ {header}: NOT FOUND")
-                all_passed = False
         
         # Check for HSTS (only present over HTTPS)
         hsts_header = response.headers.get('Strict-Transport-Security')
@@ -92,7 +84,7 @@ if __name__ == '__main__':
     print("🚀 Starting Django server with DEBUG=False...\n")
     
     # Start server in background
-    server_process = start_server()
+    server_process = start_server(PRODUCTION_ENV)
     
     try:
         # Run tests
@@ -104,5 +96,4 @@ if __name__ == '__main__':
     finally:
         # Stop server
         print("\n🛑 Stopping server...")
-        server_process.terminate()
-        server_process.wait()
+        stop_server(server_process)
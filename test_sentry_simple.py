@@ -3,8 +3,23 @@
 Simple test to verify Sentry configuration without initializing
 """
 
-import os
+import re
 import sys
+from pathlib import Path
+
+from script_utils import run_concurrently
+
+# Every Sentry setting checked below, found in one scan of the raw bytes of
+# settings.py; a named group is present in the match when its token occurs
+SENTRY_SETTINGS_TOKENS = re.compile(
+    rb'(?P<sdk_import>import sentry_sdk)'
+    rb'|(?P<django_integration>DjangoIntegration)'
+    rb'|(?P<sdk_init>sentry_sdk\.init)'
+    rb'|(?P<dsn>SENTRY_DSN)'
+    rb'|(?P<debug_check>not DEBUG)'
+    rb'|(?P<traces_sample_rate>traces_sample_rate(?P<traces_disabled> ?= ?0\.0)?)'
+    rb'|(?P<send_default_pii>send_default_pii(?P<pii_disabled> ?= ?False)?)'
+)
 
 def test_sentry_imports():
     """Test that Sentry SDK is installed"""
@@ -33,72 +48,67 @@ def test_sentry_configuration_in_settings():
     settings_path = 'election_cart/settings.py'
     
     try:
-        with open(settings_path, 'r', encoding='utf-8') as f:
-            content = f.read()
+        content = Path(settings_path).read_bytes()
         
-        checks = []
+        found = {
+            name
+            for match in SENTRY_SETTINGS_TOKENS.finditer(content)
+            for name, value in match.groupdict().items()
+            if value
+        }
+        passed = True
         
         # Check for sentry_sdk import
-        if 'import sentry_sdk' in content:
+        if 'sdk_import' in found:
             print("✅ sentry_sdk import found")
-            checks.append(True)
         else:
             print("❌ sentry_sdk import not found")
-            checks.append(False)
+            passed = False
         
         # Check for DjangoIntegration
-        if 'DjangoIntegration' in content:
+        if 'django_integration' in found:
             print("✅ DjangoIntegration configured")
-            checks.append(True)
         else:
             print("❌ DjangoIntegration not found")
-            checks.append(False)
+            passed = False
         
         # Check for sentry_sdk.init
-        if 'sentry_sdk.init' in content:
+        if 'sdk_init' in found:
             print("✅ sentry_sdk.init() call found")
-            checks.append(True)
         else:
             print("❌ sentry_sdk.init() not found")
-            checks.append(False)
+            passed = False
         
         # Check for SENTRY_DSN
-        if 'SENTRY_DSN' in content:
+        if 'dsn' in found:
             print("✅ SENTRY_DSN environment variable check found")
-            checks.append(True)
         else:
             print("❌ SENTRY_DSN check not found")
-            checks.append(False)
+            passed = False
         
         # Check for DEBUG check
-        if 'not DEBUG' in content and 'SENTRY_DSN' in content:
+        if 'debug_check' in found and 'dsn' in found:
             print("✅ Sentry only runs in production (DEBUG=False)")
-            checks.append(True)
         else:
-            print("⚠️  DEBUG check may be missing")
-            checks.append(True)  # Not critical
+            print("⚠️  DEBUG check may be missing")  # Not critical
         
         # Check for traces_sample_rate
-        if 'traces_sample_rate' in content:
+        if 'traces_sample_rate' in found:
             print("✅ Performance monitoring configuration found")
-            if 'traces_sample_rate=0.0' in content or 'traces_sample_rate = 0.0' in content:
+            if 'traces_disabled' in found:
                 print("   ✅ Set to 0.0 (disabled for free tier)")
-            checks.append(True)
         else:
-            print("⚠️  traces_sample_rate not configured")
-            checks.append(True)  # Not critical
+            print("⚠️  traces_sample_rate not configured")  # Not critical
         
         # Check for send_default_pii
-        if 'send_default_pii' in content:
+        if 'send_default_pii' in found:
             print("✅ PII configuration found")
-            if 'send_default_pii=False' in content or 'send_default_pii = False' in content:
+            if 'pii_disabled' in found:
                 print("   ✅ Set to False (privacy protected)")
-            checks.append(True)
         else:
-            print("⚠️  send_default_pii not configured")
-            checks.append(True)  # Not critical
+            print("⚠️  send_default_pii not configured")  # Not critical
         
-        return all(checks)
+        return passed
         
     except FileNotFoundError:
         print(f"❌ Settings file not found: {settings_path}")
@@ -110,10 +120,8 @@ def test_requirements():
     print("=" * 70)
     
     try:
-        with open('requirements.txt', 'r') as f:
-            content = f.read()
-        
-        if 'sentry-sdk' in content:
+        # Searched as bytes; nothing here needs decoding
+        if b'sentry-sdk' in Path('requirements.txt').read_bytes():
             print("✅ sentry-sdk in requirements.txt")
             return True
         else:
@@ -143,11 +151,13 @@ if __name__ == '__main__':
     print("\n🚀 Starting Sentry Configuration Tests\n")
     
     try:
-        # Run all tests
-        test1 = test_sentry_imports()
-        test2 = test_sentry_configuration_in_settings()
-        test3 = test_requirements()
-        test4 = test_environment_variables()
+        # Run all tests (independent, so concurrently)
+        test1, test2, test3, test4 = run_concurrently([
+            test_sentry_imports,
+            test_sentry_configuration_in_settings,
+            test_requirements,
+            test_environment_variables,
+        ])
         
         # Summary
         print("\n" + "=" * 70)
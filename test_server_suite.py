@@ -0,0 +1,52 @@
+#!/usr/bin/env python
+"""
+Run the server-based logging and rate limiting tests against one shared Django server.
+
+test_security_headers.py still starts its own server: it needs DEBUG=False,
+which redirects every request to HTTPS and would break the tests run here.
+"""
+
+import sys
+
+import test_logging_with_server
+import test_rate_limiting
+from server_test_utils import start_server, stop_server, wait_until_ready
+
+if __name__ == '__main__':
+    print("\n🚀 Starting Shared Django Server for Server Tests\n")
+    
+    # Start server once; both modules' tests run against it
+    server_process = start_server()
+    
+    try:
+        print("Waiting for server to start...")
+        wait_until_ready()
+        
+        # Logging first: its requests don't count towards the login rate limit
+        results = {
+            'Server Logging': test_logging_with_server.test_server_logging(),
+            'Login Rate Limit (5/min)': test_rate_limiting.test_login_rate_limit(),
+            'Signup Rate Limit (3/hour)': test_rate_limiting.test_signup_rate_limit(),
+            'Rate Limit Logging': test_rate_limiting.test_rate_limit_logging(),
+            'Response Format': test_rate_limiting.test_rate_limit_response_format(),
+        }
+        
+        # Summary
+        print("\n" + "=" * 70)
+        print("📊 Test Summary")
+        print("=" * 70)
+        for name, passed in results.items():
+            print(f"  {name + ':':<31}{'✅ PASS' if passed else '❌ FAIL'}")
+        print("=" * 70)
+        
+        if all(results.values()):
+            print("\n✅ All server tests passed!")
+            sys.exit(0)
+        else:
+            print("\n❌ Some server tests failed!")
+            sys.exit(1)
+    
+    finally:
+        # Stop server
+        print("\n🛑 Stopping server...")
+        stop_server(server_process)
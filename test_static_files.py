@@ -5,23 +5,37 @@ Test script to verify WhiteNoise static file serving configuration
 
 import os
 import sys
-import time
-import subprocess
-import requests
+from functools import lru_cache
 from pathlib import Path
 
-def start_server():
-    """Start Django development server with DEBUG=False"""
-    env = os.environ.copy()
-    env['DEBUG'] = 'False'
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'election_cart.settings')
+
+@lru_cache(maxsize=None)
+def scan_static_root(static_root):
+    """
+    Walk static_root once and tally what the checks below need.
     
-    process = subprocess.Popen(
-        [sys.executable, 'manage.py', 'runserver', '8000', '--noreload'],
-        env=env,
-        stdout=subprocess.PIPE,
-        stderr=subprocess.PIPE
-    )
-    return process
+    Returns (file count, .gz paths, .br count). os.scandir entries carry their
+    type, so no file is stat'ed; the result is cached so the configuration and
+    compression checks share one walk. A missing static_root counts as empty,
+    as it would for os.walk.
+    """
+    total, gz_files, br_count = 0, [], 0
+    if not os.path.isdir(static_root):
+        return total, gz_files, br_count
+    stack = [os.fspath(static_root)]
+    while stack:
+        with os.scandir(stack.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif '.' in entry.name:
+                    total += 1
+                    if entry.name.endswith('.gz'):
+                        gz_files.append(entry.path)
+                    elif entry.name.endswith('.br'):
+                        br_count += 1
+    return total, gz_files, br_count
 
 def test_whitenoise_configuration():
     """Test that WhiteNoise is properly configured"""
@@ -29,43 +43,37 @@ def test_whitenoise_configuration():
     print("=" * 70)
     
     # Import Django settings
-    os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'election_cart.settings')
-    import django
-    django.setup()
     from django.conf import settings
     
-    checks = []
+    passed = True
     
-    # Check middleware
-    middleware = settings.MIDDLEWARE
-    if 'whitenoise.middleware.WhiteNoiseMiddleware' in middleware:
+    # Check middleware (positions indexed in one pass over the list)
+    middleware_idx = {name: i for i, name in enumerate(settings.MIDDLEWARE)}
+    whitenoise_idx = middleware_idx.get('whitenoise.middleware.WhiteNoiseMiddleware')
+    if whitenoise_idx is not None:
         print("✅ WhiteNoise middleware is configured")
         
         # Check position (should be after SecurityMiddleware)
-        security_idx = middleware.index('django.middleware.security.SecurityMiddleware')
-        whitenoise_idx = middleware.index('whitenoise.middleware.WhiteNoiseMiddleware')
+        security_idx = middleware_idx.get('django.middleware.security.SecurityMiddleware')
         
-        if whitenoise_idx == security_idx + 1:
+        if security_idx is not None and whitenoise_idx == security_idx + 1:
             print("   ✅ WhiteNoise is correctly positioned (after SecurityMiddleware)")
-            checks.append(True)
         else:
             print("   ⚠️  WhiteNoise should be immediately after SecurityMiddleware")
-            checks.append(False)
+            passed = False
     else:
         print("❌ WhiteNoise middleware not found")
-        checks.append(False)
+        passed = False
     
     # Check STATICFILES_STORAGE
     storage = getattr(settings, 'STATICFILES_STORAGE', None)
     if storage == 'whitenoise.storage.CompressedManifestStaticFilesStorage':
         print("✅ WhiteNoise storage configured (with compression)")
-        checks.append(True)
     elif storage and 'whitenoise' in storage.lower():
         print(f"✅ WhiteNoise storage configured: {storage}")
-        checks.append(True)
     else:
         print(f"❌ WhiteNoise storage not configured (current: {storage})")
-        checks.append(False)
+        passed = False
     
     # Check STATIC_ROOT
     static_root = settings.STATIC_ROOT
@@ -73,32 +81,48 @@ def test_whitenoise_configuration():
         print(f"✅ STATIC_ROOT exists: {static_root}")
         
         # Count static files
-        static_files = list(Path(static_root).rglob('*.*'))
-        print(f"   📁 {len(static_files)} static files collected")
-        checks.append(True)
+        file_count, _, _ = scan_static_root(str(static_root))
+        print(f"   📁 {file_count} static files collected")
     else:
         print(f"❌ STATIC_ROOT not found: {static_root}")
-        checks.append(False)
+        passed = False
     
     print("=" * 70)
     
-    return all(checks)
+    return passed
 
 def test_static_file_serving():
     """Test that static files are served correctly"""
     print("\n📦 Testing Static File Serving\n")
     print("=" * 70)
     
-    # Wait for server to start
-    time.sleep(5)
+    # Only the serving test needs the app loaded, so Django is set up here
+    import django
+    django.setup()
+    
+    from django.test import Client
+    from django.test.utils import override_settings
     
     try:
         # Test admin static files (always available)
-        admin_css_url = 'http://127.0.0.1:8000/static/admin/css/base.css'
+        admin_css_url = '/static/admin/css/base.css'
         
         print(f"📝 Testing static file: {admin_css_url}")
         
-        response = requests.get(admin_css_url, timeout=5)
+        # Drive the middleware stack in-process as production would run it.
+        # DEBUG=False is scoped to this request, so the caller's settings are
+        # untouched; secure=True stands in for the TLS proxy SECURE_SSL_REDIRECT
+        # expects. The body is streamed into a byte count, as only its size is
+        # checked.
+        with override_settings(DEBUG=False, ALLOWED_HOSTS=['testserver']):
+            response = Client().get(admin_css_url, secure=True)
+            try:
+                if response.streaming:
+                    size = sum(len(chunk) for chunk in response.streaming_content)
+                else:
+                    size = len(response.content)
+            finally:
+                response.close()
         
         print(f"\n📊 Response Details:")
         print(f"   Status Code: {response.status_code}")
@@ -117,47 +141,38 @@ def test_static_file_serving():
         
         print("\n✅ Validation:")
         
-        checks = []
+        passed = True
         
         # Check status code
         if response.status_code == 200:
             print("✅ Static file served successfully (200 OK)")
-            checks.append(True)
         else:
             print(f"❌ Unexpected status code: {response.status_code}")
-            checks.append(False)
+            passed = False
         
         # Check content type
         if 'text/css' in response.headers.get('Content-Type', ''):
             print("✅ Correct Content-Type (text/css)")
-            checks.append(True)
         else:
-            print(f"⚠️  Content-Type: {response.headers.get('Content-Type')}")
-            checks.append(True)  # Not critical
+            print(f"⚠️  Content-Type: {response.headers.get('Content-Type')}")  # Not critical
         
         # Check if content is not empty
-        if len(response.content) > 0:
-            print(f"✅ File has content ({len(response.content)} bytes)")
-            checks.append(True)
+        if size > 0:
+            print(f"✅ File has content ({size} bytes)")
         else:
             print("❌ File is empty")
-            checks.append(False)
+            passed = False
         
         # Check for WhiteNoise headers
         if cache_control and 'max-age' in cache_control:
             print(f"✅ Cache headers present (WhiteNoise is working)")
-            checks.append(True)
         else:
-            print("⚠️  Cache headers not found (may not be using WhiteNoise)")
-            checks.append(True)  # Not critical for test
+            print("⚠️  Cache headers not found (may not be using WhiteNoise)")  # Not critical for test
         
         print("=" * 70)
         
-        return all(checks)
+        return passed
         
-    except requests.exceptions.ConnectionError:
-        print("❌ Could not connect to server")
-        return False
     except Exception as e:
         print(f"❌ Error: {e}")
         return False
@@ -169,26 +184,21 @@ def test_compression():
     
     try:
         # Check if compressed files exist
-        from pathlib import Path
-        import django
         from django.conf import settings
         
-        static_root = Path(settings.STATIC_ROOT)
-        
         # Look for .gz or .br files (Brotli or Gzip)
-        gz_files = list(static_root.rglob('*.gz'))
-        br_files = list(static_root.rglob('*.br'))
+        _, gz_files, br_count = scan_static_root(str(settings.STATIC_ROOT))
         
         print(f"📁 Compressed Files:")
         print(f"   Gzip (.gz): {len(gz_files)} files")
-        print(f"   Brotli (.br): {len(br_files)} files")
+        print(f"   Brotli (.br): {br_count} files")
         
-        if gz_files or br_files:
+        if gz_files or br_count:
             print("\n✅ Static files are compressed")
             
             # Show example
             if gz_files:
-                example = gz_files[0]
+                example = Path(gz_files[0])
                 original = str(example).replace('.gz', '')
                 if Path(original).exists():
                     original_size = Path(original).stat().st_size
@@ -216,7 +226,6 @@ def test_debug_false():
     print("\n🔒 Testing with DEBUG=False\n")
     print("=" * 70)
     
-    import django
     from django.conf import settings
     
     if not settings.DEBUG:
@@ -235,40 +244,29 @@ if __name__ == '__main__':
     test1 = test_whitenoise_configuration()
     test4 = test_debug_false()
     
-    # Start server for serving tests
-    print("\nStarting Django server with DEBUG=False...")
-    server_process = start_server()
+    # Run serving tests
+    test2 = test_static_file_serving()
+    test3 = test_compression()
     
-    try:
-        # Run serving tests
-        test2 = test_static_file_serving()
-        test3 = test_compression()
-        
-        # Summary
-        print("\n" + "=" * 70)
-        print("📊 Test Summary")
-        print("=" * 70)
-        print(f"  WhiteNoise Configuration:  {'✅ PASS' if test1 else '❌ FAIL'}")
-        print(f"  Static File Serving:       {'✅ PASS' if test2 else '❌ FAIL'}")
-        print(f"  Compression:               {'✅ PASS' if test3 else '❌ FAIL'}")
-        print(f"  DEBUG=False Mode:          {'✅ PASS' if test4 else '❌ FAIL'}")
-        print("=" * 70)
-        
-        if all([test1, test2, test3, test4]):
-            print("\n✅ All WhiteNoise tests passed!")
-            print("\n📝 WhiteNoise Summary:")
-            print("   - Middleware configured correctly")
-            print("   - Compressed storage enabled")
-            print("   - Static files served successfully")
-            print("   - Works with DEBUG=False")
-            print("   - Ready for production deployment")
-            sys.exit(0)
-        else:
-            print("\n❌ Some WhiteNoise tests failed!")
-            sys.exit(1)
-            
-    finally:
-        # Stop server
-        print("\n🛑 Stopping server...")
-        server_process.terminate()
-        server_process.wait()
+    # Summary
+    print("\n" + "=" * 70)
+    print("📊 Test Summary")
+    print("=" * 70)
+    print(f"  WhiteNoise Configuration:  {'✅ PASS' if test1 else '❌ FAIL'}")
+    print(f"  Static File Serving:       {'✅ PASS' if test2 else '❌ FAIL'}")
+    print(f"  Compression:               {'✅ PASS' if test3 else '❌ FAIL'}")
+    print(f"  DEBUG=False Mode:          {'✅ PASS' if test4 else '❌ FAIL'}")
+    print("=" * 70)
+    
+    if all([test1, test2, test3, test4]):
+        print("\n✅ All WhiteNoise tests passed!")
+        print("\n📝 WhiteNoise Summary:")
+        print("   - Middleware configured correctly")
+        print("   - Compressed storage enabled")
+        print("   - Static files served successfully")
+        print("   - Works with DEBUG=False")
+        print("   - Ready for production deployment")
+        sys.exit(0)
+    else:
+        print("\n❌ Some WhiteNoise tests failed!")
+        sys.exit(1)
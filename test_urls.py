@@ -2,7 +2,7 @@
 Test script to verify URL routing
 Run with: python manage.py shell < test_urls.py
 """
-from django.urls import resolve
+from django.urls import get_resolver
 from django.urls.exceptions import Resolver404
 
 # Test URLs
@@ -11,9 +11,12 @@ test_urls = [
     '/api/admin/products/resource-fields/8/',
 ]
 
+# Look up the root resolver once and resolve every URL against it
+resolver = get_resolver()
+
 for url in test_urls:
     try:
-        match = resolve(url)
+        match = resolver.resolve(url)
         print(f"✅ {url}")
         print(f"   View: {match.func.__name__}")
         print(f"   Args: {match.kwargs}")
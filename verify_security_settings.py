@@ -12,78 +12,36 @@ os.environ['DEBUG'] = 'False'
 # Import settings
 from election_cart import settings
 
+# (label, setting name, expected value) for every security setting verified
+EXPECTED_SETTINGS = (
+    ("DEBUG Mode", 'DEBUG', False),
+    ("HTTPS Redirect", 'SECURE_SSL_REDIRECT', True),
+    ("HSTS Enabled", 'SECURE_HSTS_SECONDS', 31536000),
+    ("HSTS Subdomains", 'SECURE_HSTS_INCLUDE_SUBDOMAINS', True),
+    ("HSTS Preload", 'SECURE_HSTS_PRELOAD', True),
+    ("Secure Session Cookie", 'SESSION_COOKIE_SECURE', True),
+    ("Secure CSRF Cookie", 'CSRF_COOKIE_SECURE', True),
+    ("Content Type Nosniff", 'SECURE_CONTENT_TYPE_NOSNIFF', True),
+    ("XSS Filter", 'SECURE_BROWSER_XSS_FILTER', True),
+    ("X-Frame-Options", 'X_FRAME_OPTIONS', 'DENY'),
+    ("Proxy SSL Header", 'SECURE_PROXY_SSL_HEADER', ('HTTP_X_FORWARDED_PROTO', 'https')),
+    ("Use X-Forwarded-Host", 'USE_X_FORWARDED_HOST', True),
+    ("Use X-Forwarded-Port", 'USE_X_FORWARDED_PORT', True),
+)
+
 def verify_settings():
     """Verify all security settings are correctly configured"""
     print("🔒 Verifying Security Settings Configuration\n")
     print("=" * 70)
     
-    checks = []
-    
-    # Check DEBUG mode
-    checks.append(("DEBUG Mode", settings.DEBUG == False, f"DEBUG = {settings.DEBUG}"))
-    
-    # Check HTTPS redirect
-    checks.append(("HTTPS Redirect", 
-                   hasattr(settings, 'SECURE_SSL_REDIRECT') and settings.SECURE_SSL_REDIRECT == True,
-                   f"SECURE_SSL_REDIRECT = {getattr(settings, 'SECURE_SSL_REDIRECT', 'NOT SET')}"))
-    
-    # Check HSTS
-    checks.append(("HSTS Enabled", 
-                   hasattr(settings, 'SECURE_HSTS_SECONDS') and settings.SECURE_HSTS_SECONDS == 31536000,
-                   f"SECURE_HSTS_SECONDS = {getattr(settings, 'SECURE_HSTS_SECONDS', 'NOT SET')}"))
-    
-    checks.append(("HSTS Subdomains", 
-                   hasattr(settings, 'SECURE_HSTS_INCLUDE_SUBDOMAINS') and settings.SECURE_HSTS_INCLUDE_SUBDOMAINS == True,
-                   f"SECURE_HSTS_INCLUDE_SUBDOMAINS = {getattr(settings, 'SECURE_HSTS_INCLUDE_SUBDOMAINS', 'NOT SET')}"))
-    
-    checks.append(("HSTS Preload", 
-                   hasattr(settings, 'SECURE_HSTS_PRELOAD') and settings.SECURE_HSTS_PRELOAD == True,
-                   f"SECURE_HSTS_PRELOAD = {getattr(settings, 'SECURE_HSTS_PRELOAD', 'NOT SET')}"))
-    
-    # Check secure cookies
-    checks.append(("Secure Session Cookie", 
-                   hasattr(settings, 'SESSION_COOKIE_SECURE') and settings.SESSION_COOKIE_SECURE == True,
-                   f"SESSION_COOKIE_SECURE = {getattr(settings, 'SESSION_COOKIE_SECURE', 'NOT SET')}"))
-    
-    checks.append(("Secure CSRF Cookie", 
-                   hasattr(settings, 'CSRF_COOKIE_SECURE') and settings.CSRF_COOKIE_SECURE == True,
-                   f"CSRF_COOKIE_SECURE = {getattr(settings, 'CSRF_COOKIE_SECURE', 'NOT SET')}"))
-    
-    # Check content type options
-    checks.append(("Content Type Nosniff", 
-                   hasattr(settings, 'SECURE_CONTENT_TYPE_NOSNIFF') and settings.SECURE_CONTENT_TYPE_NOSNIFF == True,
-                   f"SECURE_CONTENT_TYPE_NOSNIFF = {getattr(settings, 'SECURE_CONTENT_TYPE_NOSNIFF', 'NOT SET')}"))
-    
-    # Check XSS filter
-    checks.append(("XSS Filter", 
-                   hasattr(settings, 'SECURE_BROWSER_XSS_FILTER') and settings.SECURE_BROWSER_XSS_FILTER == True,
-                   f"SECURE_BROWSER_XSS_FILTER = {getattr(settings, 'SECURE_BROWSER_XSS_FILTER', 'NOT SET')}"))
-    
-    # Check X-Frame-Options
-    checks.append(("X-Frame-Options", 
-                   hasattr(settings, 'X_FRAME_OPTIONS') and settings.X_FRAME_OPTIONS == 'DENY',
-                   f"X_FRAME_OPTIONS = {getattr(settings, 'X_FRAME_OPTIONS', 'NOT SET')}"))
-    
-    # Check proxy headers
-    checks.append(("Proxy SSL Header", 
-                   hasattr(settings, 'SECURE_PROXY_SSL_HEADER') and settings.SECURE_PROXY_SSL_HEADER == ('HTTP_X_FORWARDED_PROTO', 'https'),
-                   f"SECURE_PROXY_SSL_HEADER = {getattr(settings, 'SECURE_PROXY_SSL_HEADER', 'NOT SET')}"))
-    
-    checks.append(("Use X-Forwarded-Host", 
-                   hasattr(settings, 'USE_X_FORWARDED_HOST') and settings.USE_X_FORWARDED_HOST == True,
-                   f"USE_X_FORWARDED_HOST = {getattr(settings, 'USE_X_FORWARDED_HOST', 'NOT SET')}"))
-    
-    checks.append(("Use X-Forwarded-Port", 
-                   hasattr(settings, 'USE_X_FORWARDED_PORT') and settings.USE_X_FORWARDED_PORT == True,
-                   f"USE_X_FORWARDED_PORT = {getattr(settings, 'USE_X_FORWARDED_PORT', 'NOT SET')}"))
-    
-    # Print results
+    # Each setting is read once, compared with its expected value and printed
     all_passed = True
-    for name, passed, detail in checks:
+    for label, name, expected in EXPECTED_SETTINGS:
+        value = getattr(settings, name, 'NOT SET')
+        passed = value == expected
         status = "✅" if passed else "❌"
-        print(f"{status} {name:30} {detail}")
-        if not passed:
-            all_passed = False
+        print(f"{status} {label:30} {name} = {value}")
+        all_passed &= passed
     
     print("=" * 70)
     